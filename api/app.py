@@ -7,11 +7,14 @@ import os
 
 import asyncio
 from datetime import datetime, date
+import json
 import logging
+import sys
 import time
+import types
 from base64 import b64encode
 from threading import Timer
-from typing import Callable, Dict, Final, List, Optional, Union, Any
+from typing import AsyncIterator, Callable, Dict, Final, List, Optional, Union, Any
 from contextlib import asynccontextmanager
 
 import aiohttp
@@ -22,6 +25,18 @@ from Crypto.PublicKey import RSA
 
 from pydantic import BaseModel
 
+# The measurement history and the encrypted password cache are shared with the Home Assistant
+# integration. Its package __init__ needs Home Assistant, so the integration directory is
+# mounted as the ``renpho_integration`` package without running it.
+INTEGRATION_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "custom_components", "renpho")
+if "renpho_integration" not in sys.modules:
+    integration = types.ModuleType("renpho_integration")
+    integration.__path__ = [INTEGRATION_DIR]
+    sys.modules["renpho_integration"] = integration
+
+from renpho_integration.api_renpho import EncryptedPasswordCache, get_cipher
+from renpho_integration.history import NUMERIC_FIELDS, MeasurementHistory
+
 METRIC_TYPE_WEIGHT: Final = "weight"
 METRIC_TYPE_GROWTH_RECORD: Final = "growth_record"
 METRIC_TYPE_GIRTH: Final = "girth"
@@ -38,6 +53,36 @@ IiOL2CUBzu+HmIfUbQIDAQAB
 # Initialize logging
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decode upstream payloads with orjson when it is installed, the standard library otherwise
+json_loads: Callable = orjson.loads if orjson is not None else json.loads
+
+
+async def read_json(response: aiohttp.ClientResponse):
+    """
+    Read a response body and decode it with the fastest available JSON backend.
+
+    Returns None for an empty body. A body that is not JSON, such as an HTML error
+    page, raises ``aiohttp.ContentTypeError`` like ``response.json()`` does.
+    """
+    body = await response.read()
+    if not body.strip():
+        return None
+    try:
+        return json_loads(body)
+    except ValueError as e:
+        raise aiohttp.ContentTypeError(
+            response.request_info,
+            response.history,
+            status=response.status,
+            message=f"Invalid JSON response with content type {response.content_type}",
+            headers=response.headers,
+        ) from e
+
 # API Endpoints
 API_AUTH_URL = "https://renpho.qnclouds.com/api/v3/users/sign_in.json?app_id=Renpho" # Authentication Post
 API_SCALE_USERS_URL = "https://renpho.qnclouds.com/api/v3/scale_users/list_scale_user" # Scale users
@@ -51,6 +96,8 @@ MESSAGE_LIST_URL = "https://renpho.qnclouds.com/api/v2/messages/list.json" # mes
 USER_REQUEST_URL = "https://renpho.qnclouds.com/api/v2/users/request_user.json" # error
 USERS_REACH_GOAL = "https://renpho.qnclouds.com/api/v3/users/reach_goal.json" # error 404
 
+ENCRYPTED_PASSWORDS = EncryptedPasswordCache()
+
 
 from dataclasses import dataclass
 from pydantic import BaseModel
@@ -362,7 +409,7 @@ class RenphoWeight:
         self.login_data = None
         self.users = []
         self.weight_info = None
-        self.weight_history = []
+        self.weight_history = MeasurementHistory()
         self.weight: float = None
         self.weight_goal = {}
         self.device_info = None
@@ -376,6 +423,7 @@ class RenphoWeight:
         self._last_updated_girth_goal = None
         self._last_updated_growth_record = None
         self.auth_in_progress = False
+        self.backfill_checkpoints: Dict[str, int] = {}
         self.is_polling_active = False
         self.proxy = proxy
 
@@ -474,8 +522,10 @@ class RenphoWeight:
                 try:
                     async with session.request(method, url, **kwargs) as response:
                         response.raise_for_status()
-                        parsed_response = await response.json()
+                        parsed_response = await read_json(response)
 
+                        if not isinstance(parsed_response, dict):
+                            raise APIError(f"API request failed {method} {url}: empty or invalid response")
                         if parsed_response.get("status_code") == "40302":
                             skip_auth = False
                             auth_success = await self.auth()
@@ -496,8 +546,7 @@ class RenphoWeight:
     @staticmethod
     def encrypt_password(public_key_str, password):
         try:
-            rsa_key = RSA.importKey(public_key_str)
-            cipher = PKCS1_v1_5.new(rsa_key)
+            cipher = get_cipher(public_key_str)
             return b64encode(cipher.encrypt(password.encode("utf-8"))).decode("utf-8")
         except Exception as e:
             _LOGGER.error(f"Encryption error: {e}")
@@ -535,7 +584,7 @@ class RenphoWeight:
             _LOGGER.error("Public key is None.")
             raise AuthenticationError("Public key is None.")
 
-        encrypted_password = self.encrypt_password(self.public_key, self.password)
+        encrypted_password = ENCRYPTED_PASSWORDS.get(self.public_key, self.email, self.password)
 
         data = self.prepare_data({"secure_flag": "1", "email": self.email,
                 "password": encrypted_password})
@@ -556,12 +605,15 @@ class RenphoWeight:
 
                     async with session.request("POST", API_AUTH_URL, json=data) as response:
                         response.raise_for_status()
-                        parsed = await response.json()
+                        parsed = await read_json(response)
 
                         if parsed is None:
                             _LOGGER.error("Authentication failed. No response received.")
                             raise AuthenticationError("Authentication failed. No response received.")
 
+                        if parsed.get("status_code") != "20000":
+                            ENCRYPTED_PASSWORDS.invalidate(self.public_key, self.email, self.password)
+
                         if parsed.get("status_code") == "50000" and parsed.get("status_message") == "Email was not registered":
                             _LOGGER.warning("Email was not registered.")
                             raise AuthenticationError("Email was not registered.")
@@ -649,7 +701,7 @@ class RenphoWeight:
                     _LOGGER.error("No weight measurements found in the response.")
                     return
                 if measurements := parsed["last_ary"]:
-                    self.weight_history = [MeasurementDetail(**measurement) for measurement in measurements]
+                    self.weight_history.merge(measurements)
                     self.weight_info = self.weight_history[0] if self.weight_history else None
                     self.weight = self.weight_info.weight if self.weight_info else None
                     self.time_stamp = self.weight_info.time_stamp if self.weight_info else None
@@ -670,74 +722,65 @@ class RenphoWeight:
             _LOGGER.error(f"Failed to fetch weight measurements: {e}")
             return None
 
-    async def get_measurements_history(self):
+    async def iter_measurement_pages(self, all_users: bool = False, resume: bool = True) -> AsyncIterator[List[MeasurementDetail]]:
         """
-        Fetch the most recent weight measurements_history for the user.
+        Walk the measurement history page by page via previous_flag / previous_at.
+
+        The last completed page is remembered, so after a failure a new walk with
+        resume=True continues from there instead of starting over.
         """
-        url = f"{API_MEASUREMENTS_URL}?user_id={self.user_id}&last_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
-        try:
+        checkpoint_key = "all" if all_users else str(self.user_id)
+        previous_at = self.backfill_checkpoints.get(checkpoint_key) if resume else None
+        user_query = "" if all_users else f"user_id={self.user_id}&"
+
+        while True:
+            url = f"{API_MEASUREMENTS_URL}?{user_query}last_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+            if previous_at is not None:
+                url = f"{url}&previous_at={previous_at}"
+
             parsed = await self._request("GET", url, skip_auth=True)
+            if not parsed or parsed.get("status_code") != "20000":
+                raise APIError(f"Error fetching weight measurements: {parsed.get('status_message') if parsed else 'no response'}")
 
-            if not parsed:
-                _LOGGER.error("Failed to fetch weight measurements.")
-                return
+            records = [MeasurementDetail(**measurement) for measurement in parsed.get("last_ary") or []]
+            if records:
+                yield records
 
-            if "status_code" in parsed and parsed["status_code"] == "20000":
-                if "last_ary" not in parsed:
-                    _LOGGER.error("No weight measurements found in the response.")
-                    return
-                if measurements := parsed["last_ary"]:
-                    self.weight_history = [MeasurementDetail(**measurement) for measurement in measurements]
-                    return self.weight_history
-                else:
-                    _LOGGER.error("No weight measurements found in the response.")
-                    return None
-            else:
-                # Handling different error scenarios
-                if "status_code" not in parsed:
-                    _LOGGER.error("Invalid response format received from weight measurements endpoint.")
-                else:
-                    _LOGGER.error(f"Error fetching weight measurements: Status Code {parsed.get('status_code')} - {parsed.get('status_message')}")
-                return None
+            next_previous_at = parsed.get("previous_at")
+            if not parsed.get("previous_flag") or not next_previous_at or next_previous_at == previous_at:
+                break
+            previous_at = next_previous_at
+            self.backfill_checkpoints[checkpoint_key] = previous_at
 
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch weight measurements: {e}")
-            return None
+        self.backfill_checkpoints.pop(checkpoint_key, None)
 
-    async def get_all_users_measurements_history(self):
-        """
-        Fetch the most recent weight measurements_history for the user.
-        """
-        url = f"{API_MEASUREMENTS_URL}?last_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+    async def _collect_measurement_pages(self, all_users: bool = False):
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            history = []
+            async for page in self.iter_measurement_pages(all_users=all_users):
+                history.extend(page)
 
-            if not parsed:
-                _LOGGER.error("Failed to fetch weight measurements.")
-                return
-
-            if "status_code" in parsed and parsed["status_code"] == "20000":
-                if "last_ary" not in parsed:
-                    _LOGGER.error("No weight measurements found in the response.")
-                    return
-                if measurements := parsed["last_ary"]:
-                    self.weight_history = [MeasurementDetail(**measurement) for measurement in measurements]
-                    return self.weight_history
-                else:
-                    _LOGGER.error("No weight measurements found in the response.")
-                    return None
-            else:
-                # Handling different error scenarios
-                if "status_code" not in parsed:
-                    _LOGGER.error("Invalid response format received from weight measurements endpoint.")
-                else:
-                    _LOGGER.error(f"Error fetching weight measurements: Status Code {parsed.get('status_code')} - {parsed.get('status_message')}")
+            if not history:
+                _LOGGER.error("No weight measurements found in the response.")
                 return None
-
+            self.weight_history = MeasurementHistory.from_records(history)
+            return self.weight_history.to_dicts()
         except Exception as e:
             _LOGGER.error(f"Failed to fetch weight measurements: {e}")
             return None
 
+    async def get_measurements_history(self):
+        """
+        Fetch the complete weight measurements_history for the user, page by page.
+        """
+        return await self._collect_measurement_pages()
+
+    async def get_all_users_measurements_history(self):
+        """
+        Fetch the complete weight measurements_history for every user, page by page.
+        """
+        return await self._collect_measurement_pages(all_users=True)
+
     async def get_weight(self):
         if self.weight and self.weight_info:
             return self.weight, self.weight_info
@@ -1055,7 +1098,7 @@ from starlette.responses import Response
 import httpx
 from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.security import HTTPBasic, HTTPBasicCredentials, APIKeyHeader
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_404_NOT_FOUND
 from datetime import datetime
@@ -1072,7 +1115,12 @@ API_KEY_NAME = "access_token"
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
 # Initialize FastAPI and Jinja2
-app = FastAPI(docs_url="/docs", redoc_url=None)
+# Serialize responses with orjson when it is installed
+app = FastAPI(
+    docs_url="/docs",
+    redoc_url=None,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
 
 current_directory = os.path.dirname(os.path.abspath(__file__))
 templates = Jinja2Templates(directory=os.path.join(current_directory, "templates"))
@@ -1253,6 +1301,21 @@ async def get_measurements_history(request: Request, renpho: RenphoWeight = Depe
         _LOGGER.error(f"Error fetching measurements_history: {e}")
         return APIResponse(status="error", message=str(e))
 
+@app.get("/measurements_summary", response_model=APIResponse)
+async def get_measurements_summary(request: Request, metric: str = "weight", since: Optional[int] = None, until: Optional[int] = None, renpho: RenphoWeight = Depends(get_current_user)):
+    if metric not in NUMERIC_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Unknown numeric metric {metric}")
+    try:
+        if not renpho.weight_history:
+            await renpho.get_measurements_history()
+        if renpho.weight_history:
+            summary = renpho.weight_history.aggregate(metric, since=since, until=until)
+            return APIResponse(status="success", message=f"Summarized {metric}.", data={metric: summary})
+        raise HTTPException(status_code=404, detail="Measurements not found")
+    except Exception as e:
+        _LOGGER.error(f"Error summarizing measurements: {e}")
+        return APIResponse(status="error", message=str(e))
+
 @app.get("/weight", response_model=APIResponse)
 async def get_weight(request: Request, renpho: RenphoWeight = Depends(get_current_user)):
     try:
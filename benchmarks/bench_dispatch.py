@@ -0,0 +1,101 @@
+"""
+Benchmark fanning a coordinator refresh out to the Renpho sensors on the event loop.
+
+Models the three ways a refresh reached the sensors, with one sensor per entry
+in ``sensor_configurations`` reading its value from a ``MetricSnapshot``:
+
+- one task per sensor per refresh, like the former ``hass.async_add_job`` listeners;
+- one synchronous listener per sensor;
+- one listener dispatching to every sensor, like ``RenphoSensorManager.dispatch``.
+
+Run from the repository root with the test requirements installed:
+
+    python -m benchmarks.bench_dispatch [refreshes]
+"""
+
+import asyncio
+import sys
+import time
+
+from custom_components.renpho.sensor_configs import sensor_configurations
+from custom_components.renpho.snapshot import MetricSnapshot, MetricValue
+
+
+class Sensor:
+    """Stand-in for ``RenphoSensor`` that reads its snapshot value and counts state writes."""
+
+    def __init__(self, coordinator, config):
+        self.coordinator = coordinator
+        self.key = (config["metric"], config["id"])
+        self.written = None
+        self.writes = 0
+
+    def handle_coordinator_update(self):
+        value = self.coordinator.data.values.get(self.key)
+        if value != self.written:
+            self.written = value
+            self.writes += 1
+
+    async def async_update(self):
+        self.handle_coordinator_update()
+
+
+class Coordinator:
+    """Stand-in for the ``DataUpdateCoordinator`` listener registry."""
+
+    def __init__(self):
+        self.data = None
+        self.listeners = []
+
+    def publish(self, snapshot):
+        self.data = snapshot
+        for listener in self.listeners:
+            listener()
+
+
+def snapshot(refresh: int) -> MetricSnapshot:
+    # The weight changes on every tenth refresh, every other value stays the same
+    return MetricSnapshot({
+        (config["metric"], config["id"]): MetricValue(refresh // 10 if config["id"] == "weight" else 1.0, "kg", 0)
+        for config in sensor_configurations
+    })
+
+
+async def per_refresh(strategy: str, refreshes: int) -> tuple:
+    """
+    Return the mean microseconds from publishing a snapshot until every sensor handled it,
+    and the number of state writes, which only happen for changed values.
+    """
+    loop = asyncio.get_running_loop()
+    coordinator = Coordinator()
+    sensors = [Sensor(coordinator, config) for config in sensor_configurations]
+    if strategy == "task per sensor":
+        coordinator.listeners = [lambda sensor=sensor: loop.create_task(sensor.async_update()) for sensor in sensors]
+    elif strategy == "listener per sensor":
+        coordinator.listeners = [sensor.handle_coordinator_update for sensor in sensors]
+    else:
+        coordinator.listeners = [lambda: [sensor.handle_coordinator_update() for sensor in sensors]]
+
+    snapshots = [snapshot(refresh) for refresh in range(refreshes)]
+    start = time.perf_counter()
+    for data in snapshots:
+        coordinator.publish(data)
+        # Let the loop run the scheduled tasks, as the next refresh would
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0)
+    return elapsed / refreshes * 1e6, sum(sensor.writes for sensor in sensors)
+
+
+async def main(refreshes: int = 2000):
+    print(f"{len(sensor_configurations)} sensors, {refreshes} refreshes")
+    for strategy in ("task per sensor", "listener per sensor", "one dispatching listener"):
+        micros, writes = await per_refresh(strategy, refreshes)
+        print(
+            f"  {strategy:<26} {micros:8.1f} us/refresh, "
+            f"{writes} state writes for {refreshes * len(sensor_configurations)} updates"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*map(int, sys.argv[1:2])))
@@ -0,0 +1,45 @@
+"""
+Benchmark decoding measurement responses with the standard library and with orjson.
+
+Encodes synthetic ``last_ary`` responses of 81-field records and times
+``json.loads`` against ``orjson.loads``, which ``read_json`` uses when installed.
+
+Run from the repository root with the test requirements installed:
+
+    python -m benchmarks.bench_json [records ...]
+"""
+
+import json
+import sys
+import time
+
+from custom_components.renpho.api_renpho import orjson
+
+from .payloads import last_ary
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+
+def best_of(func, body: bytes, repeat: int = 3) -> float:
+    """Return the fastest of ``repeat`` runs of ``func(body)`` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(sizes=DEFAULT_SIZES):
+    if orjson is None:
+        print("orjson is not installed; read_json falls back to json.loads")
+    for size in sizes:
+        body = json.dumps({"status_code": "20000", "status_message": "ok", "last_ary": last_ary(size)}).encode()
+        line = f"{size:>8} records, {len(body) / 1e6:6.1f} MB: json {best_of(json.loads, body) * 1e3:8.1f} ms"
+        if orjson is not None:
+            line += f", orjson {best_of(orjson.loads, body) * 1e3:8.1f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main(tuple(map(int, sys.argv[1:])) or DEFAULT_SIZES)
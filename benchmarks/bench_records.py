@@ -0,0 +1,52 @@
+"""
+Benchmark building measurement and girth records from API pages.
+
+Times validating every record with pydantic against the paths the integration
+uses: ``MeasurementHistory.merge``, which validates only new or changed
+measurements, and ``RecordFactory``, which reuses unchanged girth records.
+A repeat poll returns the same page with one edited record.
+
+Run from the repository root with the test requirements installed:
+
+    python -m benchmarks.bench_records [records]
+"""
+
+import sys
+import time
+
+from custom_components.renpho.api_object import Girth, MeasurementDetail, RecordFactory
+from custom_components.renpho.history import MeasurementHistory
+
+from .payloads import girths, last_ary
+
+
+def timed(func) -> float:
+    """Return the milliseconds one call of ``func`` takes."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def edited(page, field: str):
+    """Return ``page`` with ``field`` of its newest record changed."""
+    return [{**page[0], field: page[0][field] + 0.5}, *page[1:]]
+
+
+def main(count: int = 10_000):
+    measurements = last_ary(count)
+    history = MeasurementHistory()
+    print(f"{count} measurements ({len(MeasurementDetail.model_fields)} fields)")
+    print(f"  validate every record        {timed(lambda: [MeasurementDetail(**data) for data in measurements]):8.1f} ms")
+    print(f"  history merge, first poll    {timed(lambda: history.merge(measurements)):8.1f} ms")
+    print(f"  history merge, repeat poll   {timed(lambda: history.merge(edited(measurements, 'weight'))):8.1f} ms")
+
+    girth_page = girths(count)
+    factory = RecordFactory(Girth, "girth_id")
+    print(f"{count} girths ({len(Girth.model_fields)} fields)")
+    print(f"  validate every record        {timed(lambda: [Girth(**data) for data in girth_page]):8.1f} ms")
+    print(f"  factory, first poll          {timed(lambda: factory.build_many(girth_page)):8.1f} ms")
+    print(f"  factory, repeat poll         {timed(lambda: factory.build_many(edited(girth_page, 'waist_value'))):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
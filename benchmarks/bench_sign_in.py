@@ -0,0 +1,62 @@
+"""
+Benchmark the CPU spent encrypting the sign-in password, per sign-in.
+
+Compares parsing the public key for every sign-in, the cached cipher from
+``get_cipher`` and a hit in ``EncryptedPasswordCache``, over many accounts.
+
+Run from the repository root with the test requirements installed:
+
+    python -m benchmarks.bench_sign_in [accounts] [rounds]
+"""
+
+import sys
+import time
+from base64 import b64encode
+
+from Crypto.Cipher import PKCS1_v1_5
+from Crypto.PublicKey import RSA
+
+from custom_components.renpho.api_renpho import EncryptedPasswordCache, RenphoWeight, get_cipher
+from custom_components.renpho.const import CONF_PUBLIC_KEY
+
+
+def encrypt_uncached(public_key_str: str, password: str) -> str:
+    """Encrypt like ``encrypt_password`` did before the cipher was cached."""
+    cipher = PKCS1_v1_5.new(RSA.importKey(public_key_str))
+    return b64encode(cipher.encrypt(password.encode("utf-8"))).decode("utf-8")
+
+
+def per_sign_in(func, credentials, rounds: int) -> float:
+    """Return the mean microseconds of ``func(email, password)`` over every credential and round."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for email, password in credentials:
+            func(email, password)
+    return (time.perf_counter() - start) / (rounds * len(credentials)) * 1e6
+
+
+def main(accounts: int = 500, rounds: int = 5):
+    credentials = [(f"user{i}@example.com", f"password-{i}") for i in range(accounts)]
+    get_cipher.cache_clear()
+    cache = EncryptedPasswordCache(maxsize=accounts)
+    for email, password in credentials:
+        cache.get(CONF_PUBLIC_KEY, email, password)
+
+    results = {
+        "import key + new cipher + encrypt": per_sign_in(
+            lambda email, password: encrypt_uncached(CONF_PUBLIC_KEY, password), credentials, rounds
+        ),
+        "cached cipher + encrypt": per_sign_in(
+            lambda email, password: RenphoWeight.encrypt_password(CONF_PUBLIC_KEY, password), credentials, rounds
+        ),
+        "encrypted-password cache hit": per_sign_in(
+            lambda email, password: cache.get(CONF_PUBLIC_KEY, email, password), credentials, rounds
+        ),
+    }
+    print(f"{accounts} accounts x {rounds} rounds")
+    for name, micros in results.items():
+        print(f"  {name:<36} {micros:8.1f} us/sign-in")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
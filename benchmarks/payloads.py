@@ -0,0 +1,50 @@
+"""Synthetic Renpho API payloads for the benchmarks."""
+
+import random
+from typing import Dict, List, get_args
+
+from pydantic import BaseModel
+
+from custom_components.renpho.api_object import Girth, MeasurementDetail
+
+FIRST_TIME_STAMP = 1500000000
+
+
+def _values(model: type[BaseModel], record_id: int, rng: random.Random) -> Dict:
+    """Return a value for every field of ``model``."""
+    values = {}
+    for field, annotation in model.__annotations__.items():
+        types = get_args(annotation) or (annotation,)
+        if str in types:
+            values[field] = f"{field}-{record_id % 7}"
+        elif float in types:
+            values[field] = round(rng.uniform(1, 100), 1)
+        else:
+            values[field] = rng.randint(0, 1000)
+    return values
+
+
+def measurement(record_id: int, rng: random.Random) -> Dict:
+    """Return a raw ``last_ary`` record with a value for every ``MeasurementDetail`` field."""
+    record = _values(MeasurementDetail, record_id, rng)
+    record.update(id=record_id, b_user_id=1, time_stamp=FIRST_TIME_STAMP + record_id * 3600, time_zone="Europe/Berlin")
+    return record
+
+
+def girth(record_id: int, rng: random.Random) -> Dict:
+    """Return a raw ``girths`` record with a value for every ``Girth`` field."""
+    record = _values(Girth, record_id, rng)
+    record.update(girth_id=record_id, user_id=1, time_stamp=FIRST_TIME_STAMP + record_id * 3600, time_zone="Europe/Berlin")
+    return record
+
+
+def last_ary(count: int, seed: int = 0) -> List[Dict]:
+    """Return ``count`` raw measurement records, newest first, as the measurements endpoint does."""
+    rng = random.Random(seed)
+    return [measurement(record_id, rng) for record_id in reversed(range(count))]
+
+
+def girths(count: int, seed: int = 0) -> List[Dict]:
+    """Return ``count`` raw girth records, newest first, as the girth endpoint does."""
+    rng = random.Random(seed)
+    return [girth(record_id, rng) for record_id in reversed(range(count))]
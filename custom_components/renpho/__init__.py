@@ -1,19 +1,37 @@
 import asyncio
 import logging
+import os
 
 from httpcore import TimeoutException
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_EMAIL,
     CONF_PASSWORD,
+    CONF_PROXY,
+    CONF_PROXY_CIRCUIT_BREAKER,
+    CONF_PROXY_FAILURE_THRESHOLD,
+    CONF_PROXY_HEALTH_TTL,
+    CONF_PROXY_RECOVERY_INTERVAL,
     CONF_PUBLIC_KEY,
     CONF_REFRESH,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_USER_ID,
+    DATA_COORDINATOR,
     DOMAIN,
     EVENT_HOMEASSISTANT_STOP,
+    MEASUREMENT_DB_FILENAME,
+    SESSION_SAVE_DELAY,
+    SESSION_STORAGE_KEY,
+    SESSION_STORAGE_VERSION,
+    SYNC_SAVE_DELAY,
+    SYNC_STORAGE_KEY,
+    SYNC_STORAGE_VERSION,
 )
 from .api_renpho import RenphoWeight
+from .measurement_store import MeasurementStore
+from .proxy_health import DEFAULT_FAILURE_THRESHOLD, DEFAULT_PROXY_HEALTH_TTL, DEFAULT_RECOVERY_INTERVAL
 
 
 # Initialize logger
@@ -33,7 +51,9 @@ async def async_setup(hass, config):
 
 async def async_setup_entry(hass, entry):
     """Set up Renpho from a config entry."""
-    await setup_renpho(hass, entry.data)
+    # The proxy health settings can be changed later in the options flow
+    await setup_renpho(hass, {**entry.data, **entry.options}, entry)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     hass.async_create_task(
         hass.config_entries.async_forward_entry_setup(entry, "sensor")
@@ -42,41 +62,138 @@ async def async_setup_entry(hass, entry):
     return True
 
 
+async def async_reload_entry(hass, entry):
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass, entry):
     """Unload a config entry."""
     # Remove Renpho instance if it exists
     await hass.config_entries.async_forward_entry_unload(entry, "sensor")
     if DOMAIN in hass.data:
+        await hass.data[DOMAIN].close()
         del hass.data[DOMAIN]
+        hass.data.pop(DATA_COORDINATOR, None)
         return True
 
 
+async def async_remove_entry(hass, entry):
+    """Forget the persisted session when the config entry is removed."""
+    await Store(hass, SESSION_STORAGE_VERSION, SESSION_STORAGE_KEY).async_remove()
+    await Store(hass, SYNC_STORAGE_VERSION, SYNC_STORAGE_KEY).async_remove()
+    await hass.async_add_executor_job(remove_measurement_store, hass)
+
+
 # ------------------- Helper Methods -------------------
 
-async def setup_renpho(hass, conf):
-    """Common setup logic for YAML and UI."""
+async def setup_renpho(hass, conf, entry=None):
+    """
+    Common setup logic for YAML and UI.
+
+    With a config ``entry`` the shutdown listener is removed when the entry is
+    unloaded, so a reload does not keep the previous client alive.
+    """
     email = conf[CONF_EMAIL]
     password = conf[CONF_PASSWORD]
     unit_of_measurement = conf.get(CONF_UNIT_OF_MEASUREMENT, "kg")
     user_id = conf.get(CONF_USER_ID)
     refresh = conf.get(CONF_REFRESH, 60)
-    proxy = conf.get("proxy", None)
+    proxy = conf.get(CONF_PROXY, None)
+    measurement_store = await open_measurement_store(hass)
     renpho = RenphoWeight(
         email=email,
         password=password,
         user_id=user_id,
         refresh=refresh,
-        proxy=proxy
+        proxy=proxy,
+        proxy_circuit_breaker=conf.get(CONF_PROXY_CIRCUIT_BREAKER, False),
+        proxy_failure_threshold=conf.get(CONF_PROXY_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+        proxy_recovery_interval=conf.get(CONF_PROXY_RECOVERY_INTERVAL, DEFAULT_RECOVERY_INTERVAL),
+        proxy_health_ttl=conf.get(CONF_PROXY_HEALTH_TTL, DEFAULT_PROXY_HEALTH_TTL),
+        measurement_store=measurement_store,
     )
+    await restore_session(hass, renpho)
+    await restore_sync_state(hass, renpho)
+    await renpho.async_load_stored_history()
     hass.data[DOMAIN] = renpho
+
+    async def async_close_session(event):
+        """Close the pooled HTTP session when Home Assistant stops."""
+        await renpho.close()
+
+    remove_stop_listener = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_close_session)
+    if entry is not None:
+        entry.async_on_unload(remove_stop_listener)
     hass.data[CONF_EMAIL] = email
     hass.data[CONF_USER_ID] = user_id
     hass.data[CONF_REFRESH] = refresh
+    hass.data[CONF_ADAPTIVE_POLLING] = conf.get(CONF_ADAPTIVE_POLLING, False)
     hass.data[CONF_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
     return True
 
 
+async def restore_session(hass, renpho):
+    """
+    Restore the persisted session key so startup does not need a sign-in.
+
+    Every new sign-in is written back to the store; a stored key that the API
+    rejects is replaced by a fresh sign-in on the first request.
+    """
+    store = Store(hass, SESSION_STORAGE_VERSION, SESSION_STORAGE_KEY)
+    try:
+        renpho.restore_session(await store.async_load())
+    except Exception as e:
+        _LOGGER.warning(f"Failed to restore Renpho session: {e}")
+
+    renpho.on_session_update = lambda: store.async_delay_save(renpho.session_data, SESSION_SAVE_DELAY)
+
+
+async def restore_sync_state(hass, renpho):
+    """
+    Restore the incremental sync cursors so a restart does not re-download the history.
+
+    The cursors are written back after every sync that received new records.
+    """
+    store = Store(hass, SYNC_STORAGE_VERSION, SYNC_STORAGE_KEY)
+    try:
+        data = await store.async_load()
+        if data and data.get("email") == renpho.email:
+            renpho.restore_sync_state(data)
+    except Exception as e:
+        _LOGGER.warning(f"Failed to restore Renpho sync state: {e}")
+
+    renpho.on_sync_update = lambda: store.async_delay_save(
+        lambda: {"email": renpho.email, **renpho.sync_state()}, SYNC_SAVE_DELAY
+    )
+
+
+async def open_measurement_store(hass):
+    """
+    Open the local measurement history database.
+
+    Returns None if the database cannot be opened; the integration then keeps
+    history in memory only and downloads it again after a restart.
+    """
+    store = MeasurementStore(hass.config.path(STORAGE_DIR, MEASUREMENT_DB_FILENAME))
+    try:
+        await store.async_open()
+    except Exception as e:
+        _LOGGER.warning(f"Failed to open Renpho measurement store: {e}")
+        return None
+    return store
+
+
+def remove_measurement_store(hass):
+    """Delete the local measurement history database and its journal files."""
+    path = hass.config.path(STORAGE_DIR, MEASUREMENT_DB_FILENAME)
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
+
 
 # ------------------- Main Method for Testing -------------------
 
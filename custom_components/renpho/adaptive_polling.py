@@ -0,0 +1,158 @@
+"""Adaptive polling intervals learned from a user's weigh-in times."""
+
+import datetime
+import functools
+import logging
+import re
+from collections import Counter
+from typing import Final, Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BUCKET_MINUTES: Final = 30  # Width of one time-of-day histogram bucket
+DEFAULT_MIN_SAMPLES: Final = 5  # Measurements needed before polling adapts
+DEFAULT_WINDOW_SHARE: Final = 0.05  # Share of weigh-ins that makes a bucket an active window
+DEFAULT_MAX_INTERVAL: Final = 60 * 60  # Upper bound of the backed-off interval in seconds
+DEFAULT_HISTORY_DAYS: Final = 90  # Only weigh-ins this recent shape the histogram
+
+_UTC_OFFSET = re.compile(r"(?:UTC|GMT)?\s*([+-])(\d{1,2}):?(\d{2})?$", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def parse_time_zone(name: Optional[str]) -> datetime.tzinfo:
+    """
+    Return the tzinfo for a Renpho ``time_zone`` value.
+
+    Accepts IANA names (``Europe/Paris``) and UTC offsets (``+08:00``, ``GMT-5``).
+    Falls back to UTC for anything else.
+    """
+    if name:
+        try:
+            return ZoneInfo(name)
+        except Exception:
+            pass
+        if match := _UTC_OFFSET.search(name.strip()):
+            sign, hours, minutes = match.groups()
+            offset = datetime.timedelta(hours=int(hours), minutes=int(minutes or 0))
+            return datetime.timezone(-offset if sign == "-" else offset)
+    return datetime.timezone.utc
+
+
+class AdaptivePolling:
+    """
+    Poll often around a user's usual weigh-in times and back off in between.
+
+    Weigh-ins are counted in a time-of-day histogram of ``bucket_minutes`` wide
+    buckets, in the time zone the scale reported. A bucket that holds at least
+    ``window_share`` of the weigh-ins, together with its neighbours, is an active
+    window. Inside a window, and right after a new measurement arrived, the
+    coordinator polls at ``min_interval``. Outside, every poll without new data
+    doubles the interval up to ``max_interval``, but never past the start of the
+    next window. Until ``min_samples`` weigh-ins are known the interval stays at
+    ``min_interval``.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        bucket_minutes: int = DEFAULT_BUCKET_MINUTES,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        window_share: float = DEFAULT_WINDOW_SHARE,
+        history_days: int = DEFAULT_HISTORY_DAYS,
+    ):
+        """Initialize with an empty histogram."""
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.bucket_minutes = bucket_minutes
+        self.min_samples = min_samples
+        self.window_share = window_share
+        self.history_days = history_days
+        self.buckets = (24 * 60) // bucket_minutes
+        self.histogram: List[int] = [0] * self.buckets
+        self.samples = 0
+        self.time_zone: datetime.tzinfo = datetime.timezone.utc
+        self.interval = min_interval
+        self._active: List[bool] = [True] * self.buckets
+
+    def learn(self, records: Iterable, now: Optional[float] = None):
+        """
+        Rebuild the histogram from measurement records.
+
+        Records need ``time_stamp`` (epoch seconds) and ``time_zone`` attributes,
+        like ``MeasurementDetail``.
+        """
+        now = now if now is not None else datetime.datetime.now(datetime.timezone.utc).timestamp()
+        oldest = now - self.history_days * 24 * 60 * 60
+        histogram = [0] * self.buckets
+        zones = Counter()
+        for record in records:
+            if record.time_stamp < oldest:
+                continue
+            zones[record.time_zone] += 1
+            histogram[self._bucket(record.time_stamp, parse_time_zone(record.time_zone))] += 1
+
+        self.histogram = histogram
+        self.samples = sum(histogram)
+        if zones:
+            self.time_zone = parse_time_zone(zones.most_common(1)[0][0])
+
+        if self.samples < self.min_samples:
+            self._active = [True] * self.buckets
+            return
+        threshold = self.window_share * self.samples
+        self._active = [
+            histogram[i - 1] + histogram[i] + histogram[(i + 1) % self.buckets] >= threshold
+            for i in range(self.buckets)
+        ]
+        _LOGGER.debug(
+            f"Learned {self.samples} weigh-ins; {sum(self._active)} of {self.buckets} time-of-day buckets are active."
+        )
+
+    def _bucket(self, timestamp: float, tz: datetime.tzinfo) -> int:
+        local = datetime.datetime.fromtimestamp(timestamp, tz)
+        return (local.hour * 60 + local.minute) // self.bucket_minutes
+
+    def is_active(self, now: float) -> bool:
+        """Return True if ``now`` (epoch seconds) falls into an active weigh-in window."""
+        return self._active[self._bucket(now, self.time_zone)]
+
+    def seconds_until_active(self, now: float) -> float:
+        """Return the seconds from ``now`` until the next active window starts, 0 if inside one."""
+        local = datetime.datetime.fromtimestamp(now, self.time_zone)
+        minute = local.hour * 60 + local.minute + local.second / 60
+        bucket = int(minute) // self.bucket_minutes
+        for step in range(self.buckets):
+            if self._active[(bucket + step) % self.buckets]:
+                if step == 0:
+                    return 0
+                return ((bucket + step) * self.bucket_minutes - minute) * 60
+        return float(self.max_interval)
+
+    def next_interval(self, now: float, new_data: bool) -> float:
+        """
+        Return the seconds until the next poll.
+
+        Parameters:
+            now (float): Current time in epoch seconds.
+            new_data (bool): Whether the last poll returned a new measurement.
+        """
+        if new_data or self.is_active(now):
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * 2)
+            self.interval = max(self.min_interval, min(self.interval, self.seconds_until_active(now)))
+        return self.interval
+
+    def as_dict(self) -> dict:
+        """Return the learned windows and current interval for diagnostics."""
+        return {
+            "samples": self.samples,
+            "interval": self.interval,
+            "time_zone": str(self.time_zone),
+            "active_windows": [
+                f"{(i * self.bucket_minutes) // 60:02d}:{(i * self.bucket_minutes) % 60:02d}"
+                for i, active in enumerate(self._active) if active
+            ] if self.samples >= self.min_samples else [],
+        }
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, Generic, Iterable, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
@@ -282,4 +282,55 @@ class GirthResponse(BaseModel):
     last_updated_at: int
 
     def get(self, key, default=None):
-        return getattr(self, key, default)
\ No newline at end of file
+        return getattr(self, key, default)
+
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class RecordFactory(Generic[ModelT]):
+    """
+    Build API records, validating a record only when it is new or has changed.
+
+    Polls return mostly the same records again and again. The factory keeps the
+    record it last built for every id and returns it as-is while the incoming
+    data still matches its fields, so only new or edited records go through
+    pydantic validation.
+
+    Attributes:
+        validated (int): Records built with full validation.
+        reused (int): Records returned from a previous build.
+    """
+
+    def __init__(self, model: Type[ModelT], id_field: str):
+        """Initialize the factory for ``model`` records identified by ``id_field``."""
+        self.model = model
+        self.id_field = id_field
+        self.validated = 0
+        self.reused = 0
+        self._records: Dict[Any, ModelT] = {}
+
+    def build(self, data: Dict[str, Any]) -> ModelT:
+        """Build one record."""
+        record_id = data.get(self.id_field)
+        record = self._records.get(record_id)
+        # Extra keys in ``data`` are ignored by the model, so only its own fields have to match
+        if record is not None and record.__dict__.items() <= data.items():
+            self.reused += 1
+            return record
+
+        record = self.model(**data)
+        if record_id is not None:
+            self._records[record_id] = record
+        self.validated += 1
+        return record
+
+    def build_many(self, items: Iterable[Dict[str, Any]]) -> List[ModelT]:
+        """Build a list of records."""
+        return [self.build(data) for data in items]
+
+    def forget(self, record_ids: Iterable[Any]):
+        """Drop the records of deleted ids."""
+        for record_id in record_ids:
+            self._records.pop(record_id, None)
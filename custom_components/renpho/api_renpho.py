@@ -1,9 +1,13 @@
 import asyncio
 import datetime
+import functools
+import hashlib
+import json
 import logging
 import time
 from base64 import b64encode
-from typing import Callable, Dict, Final, List, Optional, Union
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Dict, Final, List, Optional, Union
 
 import aiohttp
 from aiohttp import ClientTimeout
@@ -11,19 +15,56 @@ from aiohttp_socks import ProxyConnector
 from Crypto.Cipher import PKCS1_v1_5
 from Crypto.PublicKey import RSA
 
-from .const import CONF_PUBLIC_KEY
+from .const import CONF_PUBLIC_KEY, ENDPOINT_DEVICE_INFO, ENDPOINT_LATEST_MODEL
+from .history import MeasurementHistory
+from .indexes import GirthGoalIndex, GirthIndex
+from .measurement_store import MeasurementStore
+from .proxy_health import DEFAULT_FAILURE_THRESHOLD, DEFAULT_PROXY_HEALTH_TTL, DEFAULT_RECOVERY_INTERVAL, ProxyHealth
+from .retry_policy import RetryPolicy, describe_error, is_retryable
+from .token_manager import DEFAULT_TOKEN_MAX_AGE, TokenManager
 
 METRIC_TYPE_WEIGHT: Final = "weight"
 METRIC_TYPE_GROWTH_RECORD: Final = "growth_record"
 METRIC_TYPE_GIRTH: Final = "girth"
 METRIC_TYPE_GIRTH_GOAL: Final = "girth_goals"
 
-from .api_object import UserResponse, DeviceBind, MeasurementDetail, Users, GirthGoal, GirthGoalsResponse, Girth, GirthResponse, MeasurementResponse
+from .api_object import UserResponse, DeviceBind, MeasurementDetail, Users, GirthGoal, GirthGoalsResponse, Girth, GirthResponse, MeasurementResponse, RecordFactory
 
 # Initialize logging
 _LOGGER = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decode upstream payloads with orjson when it is installed, the standard library otherwise
+json_loads: Callable = orjson.loads if orjson is not None else json.loads
+
+
+async def read_json(response: aiohttp.ClientResponse):
+    """
+    Read a response body and decode it with the fastest available JSON backend.
+
+    Returns None for an empty body. A body that is not JSON, such as an HTML error
+    page, raises ``aiohttp.ContentTypeError`` like ``response.json()`` does.
+    """
+    body = await response.read()
+    if not body.strip():
+        return None
+    try:
+        return json_loads(body)
+    except ValueError as e:
+        raise aiohttp.ContentTypeError(
+            response.request_info,
+            response.history,
+            status=response.status,
+            message=f"Invalid JSON response with content type {response.content_type}",
+            headers=response.headers,
+        ) from e
+
 # API Endpoints
+API_BASE_URL = "https://renpho.qnclouds.com/" # Used to probe proxy connectivity
 API_AUTH_URL = "https://renpho.qnclouds.com/api/v3/users/sign_in.json?app_id=Renpho" # Authentication Post
 API_SCALE_USERS_URL = "https://renpho.qnclouds.com/api/v3/scale_users/list_scale_user" # Scale users
 API_MEASUREMENTS_URL = "https://renpho.qnclouds.com/api/v2/measurements/list.json" # Measurements
@@ -36,6 +77,80 @@ MESSAGE_LIST_URL = "https://renpho.qnclouds.com/api/v2/messages/list.json" # mes
 USER_REQUEST_URL = "https://renpho.qnclouds.com/api/v2/users/request_user.json" # error
 USERS_REACH_GOAL = "https://renpho.qnclouds.com/api/v3/users/reach_goal.json" # error 404
 
+# HTTP session defaults
+DEFAULT_HEADERS: Final = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "User-Agent": "Renpho/2.1.0 (iPhone; iOS 14.4; Scale/2.1.0; en-US)",
+}
+DEFAULT_TIMEOUT: Final = 60  # Total timeout per request in seconds
+DEFAULT_POOL_LIMIT: Final = 10  # Max open connections for the session
+DEFAULT_POOL_LIMIT_PER_HOST: Final = 5  # Max open connections to renpho.qnclouds.com
+DEFAULT_KEEPALIVE_TIMEOUT: Final = 60  # Seconds an idle connection is kept warm
+DEFAULT_DNS_CACHE_TTL: Final = 300  # Seconds a resolved host is cached
+PROXY_PROBE_TIMEOUT: Final = 10  # Timeout for a proxy connectivity probe in seconds
+BACKFILL_ALL_USERS: Final = "all"  # Backfill checkpoint key when walking every user
+DEFAULT_FULL_SYNC_INTERVAL: Final = 24 * 60 * 60  # Seconds between full history reconciles
+ENCRYPTED_PASSWORD_CACHE_SIZE: Final = 256  # Max credentials whose encrypted password is kept
+DEFAULT_REFRESH_CONCURRENCY: Final = 3  # Endpoints fetched in parallel during a refresh
+DEFAULT_ENDPOINT_TIMEOUT: Final = 30  # Seconds a single endpoint may take during a refresh
+
+
+@functools.lru_cache(maxsize=8)
+def get_cipher(public_key_str: str):
+    """Parse the RSA public key once per process and return its PKCS1_v1_5 cipher."""
+    return PKCS1_v1_5.new(RSA.importKey(public_key_str))
+
+
+class EncryptedPasswordCache:
+    """
+    LRU cache of encrypted sign-in passwords, keyed by a digest of the credential.
+
+    PKCS1_v1_5 padding is random, so any previously produced ciphertext stays valid
+    for the same key and password. Entries are keyed by a SHA-256 of public key,
+    email and password, so a changed password never hits a stale entry, and
+    ``invalidate`` drops an entry once the API rejects it.
+    """
+
+    def __init__(self, maxsize: int = ENCRYPTED_PASSWORD_CACHE_SIZE):
+        """Initialize an empty cache holding at most ``maxsize`` entries."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def _key(public_key_str: str, email: str, password: str) -> str:
+        material = "\0".join((public_key_str, email or "", password or ""))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, public_key_str: str, email: str, password: str) -> str:
+        """Return the encrypted password, encrypting it only on a cache miss."""
+        key = self._key(public_key_str, email, password)
+        encrypted = self._entries.get(key)
+        if encrypted is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return encrypted
+
+        self.misses += 1
+        encrypted = RenphoWeight.encrypt_password(public_key_str, password)
+        self._entries[key] = encrypted
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return encrypted
+
+    def invalidate(self, public_key_str: str, email: str, password: str):
+        """Forget the encrypted password of a credential."""
+        self._entries.pop(self._key(public_key_str, email, password), None)
+
+    def clear(self):
+        """Forget every encrypted password."""
+        self._entries.clear()
+
+
+ENCRYPTED_PASSWORDS = EncryptedPasswordCache()
+
 
 class RenphoWeight:
     """
@@ -47,7 +162,26 @@ class RenphoWeight:
         user_id (str, optional): The ID of the user for whom weight data should be fetched.
     """
 
-    def __init__(self, email, password, user_id=None, refresh=60, proxy=None):
+    def __init__(
+        self,
+        email,
+        password,
+        user_id=None,
+        refresh=60,
+        proxy=None,
+        pool_limit=DEFAULT_POOL_LIMIT,
+        pool_limit_per_host=DEFAULT_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl=DEFAULT_DNS_CACHE_TTL,
+        proxy_health_ttl=DEFAULT_PROXY_HEALTH_TTL,
+        proxy_circuit_breaker=False,
+        proxy_failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+        proxy_recovery_interval=DEFAULT_RECOVERY_INTERVAL,
+        token_max_age=DEFAULT_TOKEN_MAX_AGE,
+        retry_policy=None,
+        full_sync_interval=DEFAULT_FULL_SYNC_INTERVAL,
+        measurement_store=None,
+    ):
         """Initialize a new RenphoWeight instance."""
         self.public_key: str = CONF_PUBLIC_KEY
         self.email: str = email
@@ -56,28 +190,62 @@ class RenphoWeight:
             user_id = None
         self.user_id: str = user_id
         self.refresh = refresh
-        self.token: str = None
+        self._token_manager = TokenManager(
+            self._sign_in, max_age=token_max_age, on_token_update=self._notify_session_update
+        )
+        self.on_session_update: Optional[Callable[[], None]] = None
+        self.on_sync_update: Optional[Callable[[], None]] = None
+        self.full_sync_interval = full_sync_interval
+        self._measurement_cursors: Dict[str, int] = {}
+        self._last_full_sync: Dict[str, float] = {}
+        self._history_user_id: Optional[str] = None
+        self._latest_measurement_payload: Optional[Dict] = None
+        self._backfill_checkpoints: Dict[str, int] = {}
+        # Per-user last_updated_at watermarks of the girth and girth goal endpoints
+        self._watermarks: Dict[str, Dict[str, int]] = {METRIC_TYPE_GIRTH: {}, METRIC_TYPE_GIRTH_GOAL: {}}
+        self._watermark_full_sync: Dict[str, Dict[str, float]] = {METRIC_TYPE_GIRTH: {}, METRIC_TYPE_GIRTH_GOAL: {}}
+        self._watermark_user_id: Dict[str, Optional[str]] = {METRIC_TYPE_GIRTH: None, METRIC_TYPE_GIRTH_GOAL: None}
+        self.measurement_store: Optional[MeasurementStore] = measurement_store
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._inflight_requests: Dict = {}
+        self._request_counters = {"upstream": 0, "coalesced": 0}
+        self.last_refresh: Dict[str, Dict] = {}
         self.session = None
         self.polling = False
         self.login_data = None
+        self._login_payload = None
         self.users = []
         self.weight_info = None
-        self.weight_history = []
+        self.weight_history = MeasurementHistory()
+        # Girths already validated once are rebuilt without validation on later polls
+        self._girth_factory = RecordFactory(Girth, "girth_id")
         self.weight: float = None
         self.weight_goal = {}
         self.device_info = None
         self.latest_model = None
         self.girth_info = None
+        self.girth_index = GirthIndex()
         self.girth_goal = None
+        self.girth_goal_index = GirthGoalIndex()
         self.growth_record = None
         self._last_updated = None
         self._last_updated_weight = None
         self._last_updated_girth = None
         self._last_updated_girth_goal = None
         self._last_updated_growth_record = None
-        self.auth_in_progress = False
         self.is_polling_active = False
         self.proxy = proxy
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.proxy_health = ProxyHealth(
+            self._probe_proxy,
+            ttl=proxy_health_ttl,
+            circuit_breaker=proxy_circuit_breaker,
+            failure_threshold=proxy_failure_threshold,
+            recovery_interval=proxy_recovery_interval,
+        )
 
         _LOGGER.info(f"Initializing RenphoWeight instance. Proxy is {'enabled: ' + proxy if proxy else 'disabled.'}")
 
@@ -97,115 +265,229 @@ class RenphoWeight:
         else:
             return data
 
+    def _create_connector(self):
+        """
+        Build the pooled connector shared by every request of this account.
+
+        Connections are kept alive between polls and DNS lookups are cached, so a
+        refresh reuses warm TCP/TLS connections instead of handshaking per endpoint.
+        """
+        connector_kwargs = {
+            "limit": self.pool_limit,
+            "limit_per_host": self.pool_limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "ttl_dns_cache": self.dns_cache_ttl,
+            "use_dns_cache": True,
+        }
+        if self.proxy:
+            return ProxyConnector.from_url(self.proxy, **connector_kwargs)
+        return aiohttp.TCPConnector(**connector_kwargs)
+
     async def open_session(self):
         """
-        Open a new aiohttp session if one does not exist or is closed.
+        Open the long-lived aiohttp session if one does not exist or is closed.
+
+        Returns:
+            aiohttp.ClientSession: The session to use for requests.
         """
         if self.session is None or self.session.closed:
-            self.token = None
             self.session = aiohttp.ClientSession(
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
-            )
-        if self.session:
-            await self.session.close()
-            self.session = aiohttp.ClientSession(
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
+                connector=self._create_connector(),
+                headers=DEFAULT_HEADERS,
+                timeout=ClientTimeout(total=DEFAULT_TIMEOUT),
             )
+            _LOGGER.debug("Opened pooled aiohttp session.")
+        return self.session
+
+    async def _probe_proxy(self) -> bool:
+        """
+        Probe the Renpho host through the pooled session.
+
+        Any HTTP response proves the proxy can reach the API, so the status code is
+        not checked. Transport errors propagate to the caller.
+        """
+        session = await self.open_session()
+        async with session.head(
+            API_BASE_URL, allow_redirects=False, timeout=ClientTimeout(total=PROXY_PROBE_TIMEOUT)
+        ) as response:
+            _LOGGER.debug(f"Proxy probe answered with HTTP status {response.status}")
+            return True
 
     async def check_proxy(self):
         """
-        Checks if the proxy is working by making a request to a Renpho API endpoint.
+        Checks if the proxy is working by making a request to the Renpho API host.
+
+        Always probes and refreshes the cached proxy health state.
         """
-        test_url = 'http://httpbin.org/get'
-    
         if not self.proxy:
             _LOGGER.info("No proxy configured. Proceeding without proxy.")
+            return True
+
+        _LOGGER.info(f"Checking proxy connectivity using proxy: {self.proxy}")
+        healthy = await self.proxy_health.async_check()
+        if healthy:
+            _LOGGER.info("Proxy check successful.")
         else:
-            _LOGGER.info(f"Checking proxy connectivity using proxy: {self.proxy}")
-    
-        try:
-            connector = ProxyConnector.from_url(self.proxy) if self.proxy else None
-            session = aiohttp.ClientSession(connector=connector)
-            async with session.get(test_url) as response:
-                if response.status == 200:
-                    _LOGGER.info("Proxy check successful." if self.proxy else "Direct connection successful.")
-                    return True
-                else:
-                    _LOGGER.error(f"Failed to connect using {'proxy' if self.proxy else 'direct connection'}. HTTP Status: {response.status}")
-                    return False
-        except Exception as e:
-            _LOGGER.error(f"Proxy connection failed: {e}")
-            return False
-        finally:
-            await session.close()
+            _LOGGER.error(f"Proxy check failed for proxy: {self.proxy}")
+        return healthy
+
+    async def _ensure_proxy_healthy(self):
+        """
+        Fail fast when the cached proxy health says the proxy is down.
+
+        Probes only when the health state is unknown or a failed probe has expired.
+        """
+        if not self.proxy:
+            return
+        if not await self.proxy_health.async_ensure_healthy():
+            _LOGGER.error("Proxy is unhealthy. Aborting request.")
+            raise APIError(f"Proxy is unhealthy: {self.proxy_health.state}")
+
+    def _report_transport(self, success: bool):
+        """Feed the outcome of a proxied request into the proxy health state."""
+        if not self.proxy:
+            return
+        if success:
+            self.proxy_health.report_success()
+        else:
+            self.proxy_health.report_failure()
+
+    @property
+    def proxy_status(self) -> Dict:
+        """Return the cached proxy health state."""
+        return {"proxy": bool(self.proxy), **self.proxy_health.as_dict()}
 
     async def _request(self, method: str, url: str, retries: int = 3, skip_auth=False, **kwargs):
         """
         Perform an API request and return the parsed JSON response.
 
+        Identical GET requests (same URL and params) that are in flight at the same
+        time share one upstream call; see ``request_stats`` for the savings.
+
         Parameters:
             method (str): The HTTP method to use for the request (e.g., "GET", "POST").
             url (str): The URL to which the request should be made.
             retries (int, optional): The number of times to retry the request if it fails. Defaults to 3.
-            skip_auth (bool, optional): Whether to skip authentication. Defaults to False.
+            skip_auth (bool, optional): Whether to send the request without a session key. Defaults to False.
             **kwargs: Additional keyword arguments to pass to the request.
 
         Returns:
             Union[Dict, List]: The parsed JSON response from the API request.
         """
-        if not await self.check_proxy():
-            _LOGGER.error("Proxy check failed. Aborting authentication.")
-            raise APIError("Proxy check failed. Aborting authentication.")
-        while retries > 0:
-            connector = ProxyConnector.from_url(self.proxy) if self.proxy else None
-            async with aiohttp.ClientSession(connector=connector, headers={
-                            "Content-Type": "application/json",
-                            "Accept": "application/json",
-                            "User-Agent": "Renpho/2.1.0 (iPhone; iOS 14.4; Scale/2.1.0; en-US)"
-                        }, timeout=ClientTimeout(total=60)) as session:
+        if method.upper() != "GET":
+            return await self._send_request(method, url, retries, skip_auth, **kwargs)
+
+        params = kwargs.get("params") or {}
+        key = (method.upper(), url, skip_auth, tuple(sorted((str(k), str(v)) for k, v in params.items())))
+        if (inflight := self._inflight_requests.get(key)) is not None:
+            self._request_counters["coalesced"] += 1
+            _LOGGER.debug(f"Joining in-flight request {method} {url}")
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._send_request(method, url, retries, skip_auth, **kwargs))
+        self._inflight_requests[key] = task
+        task.add_done_callback(lambda done: self._request_done(key, done))
+        return await asyncio.shield(task)
+
+    def _request_done(self, key, task: asyncio.Future):
+        """Forget a finished in-flight request and consume its outcome."""
+        if self._inflight_requests.get(key) is task:
+            del self._inflight_requests[key]
+        if not task.cancelled():
+            task.exception()  # Avoid "exception was never retrieved" if every caller went away
+
+    def set_refresh_deadline(self, seconds: Optional[float]):
+        """
+        Limit retries to the time left in the current refresh.
 
-                if not self.token and not url.endswith("sign_in.json") or not skip_auth:
-                    auth_success = await self.auth()
-                    if not auth_success:
-                        raise AuthenticationError("Authentication failed. Unable to proceed with the request.")
+        Retries whose backoff would end after the deadline are skipped. Pass None
+        to clear the deadline.
+        """
+        self.retry_policy.set_deadline(seconds)
 
-                kwargs = self.prepare_data(kwargs)
+    @property
+    def request_stats(self) -> Dict:
+        """Return how many upstream calls were made and how many were saved by coalescing."""
+        return dict(self._request_counters, in_flight=len(self._inflight_requests))
 
-                try:
-                    async with session.request(method, url, **kwargs) as response:
-                        response.raise_for_status()
-                        parsed_response = await response.json()
-
-                        if parsed_response.get("status_code") == "40302":
-                            skip_auth = False
-                            auth_success = await self.auth()
-                            if not auth_success:
-                                raise AuthenticationError("Authentication failed. Unable to proceed with the request.")
-                            retries -= 1
-                            continue # Retry the request
-                        if parsed_response.get("status_code") == "50000":
-                            raise APIError(f"Internal server error: {parsed_response.get('status_message')}")
-                        if parsed_response.get("status_code") == "20000" and parsed_response.get("status_message") == "ok":
-                            return parsed_response
-                        else:
-                            raise APIError(f"API request failed {method} {url}: {parsed_response.get('status_message')}")
-                except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError) as e:
-                    _LOGGER.error(f"Client error: {e}")
-                    raise APIError(f"API request failed {method} {url}") from e
+    async def _send_request(self, method: str, url: str, retries: int = 3, skip_auth=False, **kwargs):
+        """
+        Send an API request upstream and return the parsed JSON response.
+
+        The session key is added to the query parameters at send time, so a request
+        retried after a 40302 always carries the freshly issued key. Takes the same
+        parameters as ``_request``.
+        """
+        await self._ensure_proxy_healthy()
+        kwargs = self.prepare_data(kwargs)
+        params = dict(kwargs.pop("params", None) or {})
+
+        attempt = 0
+        while retries > 0:
+            token = None
+            if not skip_auth:
+                token = await self._token_manager.async_get_token()
+                params["terminal_user_session_key"] = token
+
+            session = await self.open_session()
+            self._request_counters["upstream"] += 1
+            try:
+                async with session.request(method, url, params=params or None, **kwargs) as response:
+                    self._report_transport(success=True)
+                    response.raise_for_status()
+                    parsed_response = await read_json(response)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                    self._report_transport(success=False)
+                if is_retryable(e) and await self.retry_policy.async_wait(attempt):
+                    attempt += 1
+                    _LOGGER.warning(f"Transient error on {method} {url}: {describe_error(e)}. Retry {attempt}.")
+                    await self._ensure_proxy_healthy()
+                    continue
+                _LOGGER.error(f"Client error on {method} {url}: {describe_error(e)}")
+                raise APIError(f"API request failed {method} {url}") from e
+
+            if not isinstance(parsed_response, dict):
+                raise APIError(f"API request failed {method} {url}: empty or invalid response")
+            if parsed_response.get("status_code") == "40302":
+                _LOGGER.debug(f"Session key rejected for {method} {url}")
+                self._token_manager.invalidate(token)
+                retries -= 1
+                continue  # Retry the request with a new session key
+            if parsed_response.get("status_code") == "50000":
+                raise APIError(f"Internal server error: {parsed_response.get('status_message')}")
+            if parsed_response.get("status_code") == "20000" and parsed_response.get("status_message") == "ok":
+                return parsed_response
+            raise APIError(f"API request failed {method} {url}: {parsed_response.get('status_message')}")
+
+        raise AuthenticationError(f"Session key rejected for {method} {url}. Unable to proceed with the request.")
 
     @staticmethod
     def encrypt_password(public_key_str, password):
         try:
-            rsa_key = RSA.importKey(public_key_str)
-            cipher = PKCS1_v1_5.new(rsa_key)
+            cipher = get_cipher(public_key_str)
             return b64encode(cipher.encrypt(password.encode("utf-8"))).decode("utf-8")
         except Exception as e:
             _LOGGER.error(f"Encryption error: {e}")
             raise
 
+    @property
+    def token(self) -> Optional[str]:
+        """Return the current session key."""
+        return self._token_manager.token
+
+    @token.setter
+    def token(self, value: Optional[str]):
+        self._token_manager.set_token(value)
+
+    @property
+    def token_status(self) -> Dict:
+        """Return the age and status of the session key."""
+        return self._token_manager.as_dict()
+
     async def is_valid_session(self):
         """Check if the session key is valid."""
-        return self.token is not None
+        return self._token_manager.is_valid
 
     async def validate_credentials(self):
         """
@@ -221,13 +503,17 @@ class RenphoWeight:
 
 
     async def auth(self):
-        """Authenticate with the Renpho API."""
-
-        if self.auth_in_progress:
-            return False  # Avoid re-entry if already in progress
+        """
+        Authenticate with the Renpho API.
 
-        self.auth_in_progress = True
+        Concurrent calls share a single sign-in. Returns True once a new session key
+        has been obtained and raises AuthenticationError otherwise.
+        """
+        await self._token_manager.async_refresh()
+        return True
 
+    async def _sign_in(self) -> str:
+        """Sign in with the account credentials and return the new session key."""
         if not self.email or not self.password:
             raise AuthenticationError("Email and password are required for authentication.")
 
@@ -235,78 +521,116 @@ class RenphoWeight:
             _LOGGER.error("Public key is None.")
             raise AuthenticationError("Public key is None.")
 
-        encrypted_password = self.encrypt_password(self.public_key, self.password)
+        encrypted_password = ENCRYPTED_PASSWORDS.get(self.public_key, self.email, self.password)
 
         data = self.prepare_data({"secure_flag": "1", "email": self.email,
                 "password": encrypted_password})
 
-        for attempt in range(3):
+        attempt = 0
+        while True:
             try:
-                self.token = None
-                if not await self.check_proxy():
-                    _LOGGER.error("Proxy check failed. Aborting authentication.")
-                    raise APIError("Proxy check failed. Aborting authentication.")
-                
-                connector = ProxyConnector.from_url(self.proxy) if self.proxy else None
-                async with aiohttp.ClientSession(connector=connector, headers={
-                                "Content-Type": "application/json",
-                                "Accept": "application/json",
-                                "User-Agent": "Renpho/2.1.0 (iPhone; iOS 14.4; Scale/2.1.0; en-US)"
-                            }, timeout=ClientTimeout(total=60)) as session:
-
-                    async with session.request("POST", API_AUTH_URL, json=data) as response:
-                        response.raise_for_status()
-                        parsed = await response.json()
-
-                        if parsed is None:
-                            _LOGGER.error("Authentication failed. No response received.")
-                            raise AuthenticationError("Authentication failed. No response received.")
-
-                        if parsed.get("status_code") == "50000" and parsed.get("status_message") == "Email was not registered":
-                            _LOGGER.warning("Email was not registered.")
-                            raise AuthenticationError("Email was not registered.")
-
-                        if parsed.get("status_code") == "500" and parsed.get("status_message") == "Internal Server Error":
-                            _LOGGER.warning("Bad Password or Internal Server Error.")
-                            raise AuthenticationError("Bad Password or Internal Server Error.")
-
-                        if "terminal_user_session_key" not in parsed:
-                            _LOGGER.error(
-                                "'terminal_user_session_key' not found in parsed object.")
-                            raise AuthenticationError(f"Authentication failed: {parsed}")
-
-                        if parsed.get("status_code") == "20000" and parsed.get("status_message") == "ok":
-                            if 'terminal_user_session_key' in parsed:
-                                self.token = parsed["terminal_user_session_key"]
-                            else:
-                                self.token = None
-                                raise AuthenticationError("Session key not found in response.")
-                            if 'device_binds_ary' in parsed:
-                                parsed['device_binds_ary'] = [DeviceBind(**device) for device in parsed['device_binds_ary']]
-                            else:
-                                parsed['device_binds_ary'] = []
-                            self.login_data = UserResponse(**parsed)
-                            self.token = parsed["terminal_user_session_key"]
-                            if self.user_id is None:
-                                self.user_id = self.login_data.get("id", None)
-                            return True
-            except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError) as e:
-                _LOGGER.error(f"Authentication failed: {e}")
-                if attempt < 3 - 1:
-                    await asyncio.sleep(5)  # Wait before retrying
-                else:
-                    raise AuthenticationError(f"Authentication failed after retries. {e}") from e
-            finally:
-                self.auth_in_progress = False
+                await self._ensure_proxy_healthy()
+
+                session = await self.open_session()
+
+                async with session.request("POST", API_AUTH_URL, json=data) as response:
+                    self._report_transport(success=True)
+                    response.raise_for_status()
+                    parsed = await read_json(response)
+
+                    if not isinstance(parsed, dict):
+                        _LOGGER.error("Authentication failed. No response received.")
+                        raise AuthenticationError("Authentication failed. No response received.")
+
+                    if parsed.get("status_code") != "20000":
+                        ENCRYPTED_PASSWORDS.invalidate(self.public_key, self.email, self.password)
+
+                    if parsed.get("status_code") == "50000" and parsed.get("status_message") == "Email was not registered":
+                        _LOGGER.warning("Email was not registered.")
+                        raise AuthenticationError("Email was not registered.")
+
+                    if parsed.get("status_code") == "500" and parsed.get("status_message") == "Internal Server Error":
+                        _LOGGER.warning("Bad Password or Internal Server Error.")
+                        raise AuthenticationError("Bad Password or Internal Server Error.")
+
+                    if "terminal_user_session_key" not in parsed:
+                        _LOGGER.error(
+                            "'terminal_user_session_key' not found in parsed object.")
+                        raise AuthenticationError(f"Authentication failed: {parsed}")
+
+                    if parsed.get("status_code") == "20000" and parsed.get("status_message") == "ok":
+                        self._set_login_data(parsed)
+                        return parsed["terminal_user_session_key"]
+
+                    raise AuthenticationError(f"Authentication failed: {parsed.get('status_message')}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                    self._report_transport(success=False)
+                _LOGGER.error(f"Authentication failed: {describe_error(e)}")
+                if is_retryable(e) and await self.retry_policy.async_wait(attempt):
+                    attempt += 1
+                    continue
+                raise AuthenticationError(f"Authentication failed after {attempt + 1} attempt(s). {describe_error(e)}") from e
+
+    def _set_login_data(self, parsed: Dict):
+        """Keep the raw sign-in payload for persistence and build the validated login data."""
+        self._login_payload = {key: value for key, value in parsed.items() if key != "terminal_user_session_key"}
+        parsed = dict(parsed)
+        if 'device_binds_ary' in parsed:
+            parsed['device_binds_ary'] = [DeviceBind(**device) for device in parsed['device_binds_ary']]
+        else:
+            parsed['device_binds_ary'] = []
+        self.login_data = UserResponse(**parsed)
+        if self.user_id is None:
+            self.user_id = self.login_data.get("id", None)
+
+    def _notify_session_update(self):
+        if self.on_session_update is not None:
+            self.on_session_update()
+
+    def session_data(self) -> Dict:
+        """
+        Return the session key and sign-in metadata in a JSON serializable form.
+
+        Used to persist the session across restarts; see ``restore_session``.
+        """
+        return {
+            "email": self.email,
+            "token": self._token_manager.token,
+            "issued_at": self._token_manager.issued_at,
+            "login_data": self._login_payload,
+        }
+
+    def restore_session(self, data: Optional[Dict]) -> bool:
+        """
+        Restore a session saved by ``session_data``.
+
+        The restored key is used until the API rejects it with 40302 or it expires,
+        at which point a fresh sign-in happens. Returns True if a key was restored.
+        """
+        if not data or not data.get("token"):
+            return False
+        if data.get("email") != self.email:
+            _LOGGER.debug("Stored Renpho session belongs to another account. Ignoring it.")
+            return False
+
+        self._token_manager.set_token(data["token"], issued_at=data.get("issued_at"))
+        if login_payload := data.get("login_data"):
+            try:
+                self._set_login_data({**login_payload, "terminal_user_session_key": data["token"]})
+            except Exception as e:
+                _LOGGER.warning(f"Stored Renpho login data could not be restored: {e}")
+        _LOGGER.info(f"Restored Renpho session key ({self._token_manager.status}).")
+        return self._token_manager.is_valid
 
     async def get_scale_users(self):
         """
         Fetch the list of users associated with the scale.
         """
-        url = f"{API_SCALE_USERS_URL}?locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        url = f"{API_SCALE_USERS_URL}?locale=en&app_id=Renpho"
         # Perform the API request
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch scale users.")
@@ -335,10 +659,30 @@ class RenphoWeight:
     async def get_measurements(self):
         """
         Fetch the most recent weight measurements for the user.
+
+        Only records newer than the user's sync cursor are requested and merged into
+        ``weight_history``. The whole history is downloaded on the first sync, when
+        the user changes and every ``full_sync_interval`` seconds to reconcile edits
+        and deletions. Older pages reported by the API are followed before merging,
+        so a full sync replaces the history with every page and not only the newest.
+
+        Returns:
+            The newest measurement, an empty list if the user has no measurements, or
+            None if the request failed.
         """
-        url = f"{API_MEASUREMENTS_URL}?user_id={self.user_id}&last_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        user_key = str(self.user_id)
+        cursor = self._measurement_cursors.get(user_key)
+        full_sync = (
+            cursor is None
+            or not self.weight_history
+            or self._history_user_id != user_key
+            or time.time() - self._last_full_sync.get(user_key, 0) >= self.full_sync_interval
+        )
+        last_at = self.get_timestamp() if full_sync else cursor
+
+        url = f"{API_MEASUREMENTS_URL}?user_id={self.user_id}&last_at={last_at}&locale=en&app_id=Renpho"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch weight measurements.")
@@ -348,16 +692,17 @@ class RenphoWeight:
                 if "last_ary" not in parsed:
                     _LOGGER.error("No weight measurements found in the response.")
                     return
-                if measurements := parsed["last_ary"]:
-                    self.weight_history = [MeasurementDetail(**measurement) for measurement in measurements]
-                    self.weight_info = self.weight_history[0] if self.weight_history else None
-                    self.weight = self.weight_info.weight if self.weight_info else None
-                    self.time_stamp = self.weight_info.time_stamp if self.weight_info else None
+                measurements = await self._follow_measurement_pages(url, parsed)
+                if not measurements:
+                    # A successful empty response is not a failure; the account may have no measurements yet
+                    _LOGGER.debug(f"No new weight measurements since {last_at}.")
                     self._last_updated_weight = time.time()
-                    return self.weight_info
-                else:
-                    _LOGGER.error("No weight measurements found in the response.")
-                    return None
+                    return self.weight_info if self.weight_info is not None else []
+                self._merge_measurements(user_key, measurements, replace=full_sync)
+                if full_sync:
+                    self._last_full_sync[user_key] = time.time()
+                self._notify_sync_update()
+                return self.weight_info
             else:
                 # Handling different error scenarios
                 if "status_code" not in parsed:
@@ -370,6 +715,232 @@ class RenphoWeight:
             _LOGGER.error(f"Failed to fetch weight measurements: {e}")
             return None
 
+    async def _follow_measurement_pages(self, url: str, parsed: Dict) -> List[Dict]:
+        """Return the raw records of ``parsed`` and of every older page the API reports after it."""
+        measurements = list(parsed.get("last_ary") or [])
+        previous_at = None
+        while parsed.get("previous_flag") and parsed.get("previous_at") and parsed["previous_at"] != previous_at:
+            previous_at = parsed["previous_at"]
+            parsed = await self._request("GET", f"{url}&previous_at={previous_at}")
+            measurements.extend(parsed.get("last_ary") or [])
+        return measurements
+
+    def _merge_measurements(self, user_key: str, measurements: List[Dict], replace: bool = False, persist: bool = True):
+        """
+        Merge raw measurement records into ``weight_history`` and advance the sync cursor.
+
+        Records are deduplicated by id; only new or changed ones are validated. With
+        ``replace`` the history is rebuilt from ``measurements`` alone. With
+        ``persist`` the validated rows are queued for the measurement store once the
+        merge succeeded, so a malformed page never reaches the stored history.
+        """
+        history = self.weight_history if self._history_user_id == user_key else MeasurementHistory()
+        changed = history.merge(measurements, replace=replace)
+        if persist and self.measurement_store is not None:
+            if replace:
+                self.measurement_store.queue_replace(METRIC_TYPE_WEIGHT, user_key, history.rows_by_id())
+            else:
+                self.measurement_store.queue_upsert(
+                    METRIC_TYPE_WEIGHT, history.rows_by_id(measurement.get("id") for measurement in measurements)
+                )
+        if changed or self.weight_info is None or self._history_user_id != user_key:
+            self._set_weight_history(user_key, history)
+        else:
+            self._last_updated_weight = time.time()
+
+        newest = max(measurements, key=lambda measurement: measurement.get("time_stamp", 0))
+        if self.weight_info is not None and newest.get("id") == self.weight_info.id:
+            self._latest_measurement_payload = newest
+
+    def _set_weight_history(self, user_key: str, history: MeasurementHistory):
+        """Set ``weight_history`` and update the latest weight and the sync cursor from it."""
+        self.weight_history = history
+        self._history_user_id = user_key
+        self.weight_info = self.weight_history[0] if self.weight_history else None
+        self.weight = self.weight_info.weight if self.weight_info else None
+        self.time_stamp = self.weight_info.time_stamp if self.weight_info else None
+        self._last_updated_weight = time.time()
+
+        if self.time_stamp is not None:
+            self._measurement_cursors[user_key] = self.time_stamp
+
+    async def async_load_stored_history(self) -> bool:
+        """
+        Load weight, girth and girth goal history from the measurement store.
+
+        Called on startup so history and latest values are available without a
+        download. Returns True if any weight records were loaded.
+        """
+        user_key = self._history_user_id or (str(self.user_id) if self.user_id is not None else None)
+        if self.measurement_store is None or user_key is None:
+            return False
+
+        try:
+            records = await self.measurement_store.async_history(METRIC_TYPE_WEIGHT, user_key)
+            if records:
+                self._set_weight_history(user_key, MeasurementHistory.from_records(records))
+            girths = await self.measurement_store.async_history(METRIC_TYPE_GIRTH, user_key)
+            if girths:
+                self.girth_info = girths
+                self.girth_index.rebuild(girths)
+                self._watermark_user_id[METRIC_TYPE_GIRTH] = user_key
+            goals = await self.measurement_store.async_history(METRIC_TYPE_GIRTH_GOAL, user_key)
+            if goals:
+                self.girth_goal = goals
+                self.girth_goal_index.rebuild(goals)
+                self._watermark_user_id[METRIC_TYPE_GIRTH_GOAL] = user_key
+        except Exception as e:
+            _LOGGER.warning(f"Failed to load stored Renpho history: {e}")
+            return False
+
+        _LOGGER.info(f"Loaded {len(self.weight_history)} stored measurements for user {user_key}.")
+        return bool(self.weight_history)
+
+    async def get_stored_history(
+        self,
+        metric_type: str = METRIC_TYPE_WEIGHT,
+        user_id: Optional[str] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List:
+        """
+        Query locally stored records of a user, newest first, without contacting the API.
+
+        Falls back to the in-memory ``weight_history`` when no measurement store is configured.
+        """
+        user_id = user_id if user_id is not None else self.user_id
+        if self.measurement_store is not None:
+            return await self.measurement_store.async_history(metric_type, user_id, since=since, until=until, limit=limit)
+        if metric_type != METRIC_TYPE_WEIGHT:
+            return []
+
+        return self.weight_history.records(since=since, until=until, limit=limit)
+
+    async def iter_measurement_pages(self, user_id: Optional[str] = None, all_users: bool = False, resume: bool = True) -> AsyncIterator[List[MeasurementDetail]]:
+        """
+        Walk the measurement history page by page, newest page first.
+
+        Each page is requested with the ``previous_at`` of the page before it, until the
+        API reports ``previous_flag == 0``. A page counts as completed once the consumer
+        asks for the next one; if a request fails, the next call with ``resume=True``
+        continues after the last completed page instead of starting over.
+
+        Parameters:
+            user_id (Optional[str]): The user whose history to walk. Defaults to ``self.user_id``.
+            all_users (bool): Walk the history of every user on the account instead.
+            resume (bool): Continue from the last completed page of an interrupted walk.
+
+        Yields:
+            List[MeasurementDetail]: The records of one page.
+        """
+        user_id = user_id if user_id is not None else self.user_id
+        checkpoint_key = BACKFILL_ALL_USERS if all_users else str(user_id)
+        previous_at = self._backfill_checkpoints.get(checkpoint_key) if resume else None
+        if previous_at is not None:
+            _LOGGER.info(f"Resuming measurement backfill for {checkpoint_key} before {previous_at}.")
+
+        user_query = "" if all_users else f"user_id={user_id}&"
+        while True:
+            url = f"{API_MEASUREMENTS_URL}?{user_query}last_at={self.get_timestamp()}&locale=en&app_id=Renpho"
+            if previous_at is not None:
+                url = f"{url}&previous_at={previous_at}"
+
+            parsed = await self._request("GET", url)
+            measurements = parsed.get("last_ary") or []
+            records = [MeasurementDetail(**measurement) for measurement in measurements]
+            if records:
+                if self.measurement_store is not None:
+                    self.measurement_store.queue_upsert(METRIC_TYPE_WEIGHT, measurements)
+                yield records
+
+            next_previous_at = parsed.get("previous_at")
+            if not parsed.get("previous_flag") or not next_previous_at or next_previous_at == previous_at:
+                break
+            previous_at = next_previous_at
+            self._backfill_checkpoints[checkpoint_key] = previous_at
+            self._notify_sync_update()
+
+        self._backfill_checkpoints.pop(checkpoint_key, None)
+        self._notify_sync_update()
+        _LOGGER.info(f"Measurement backfill for {checkpoint_key} completed.")
+
+    async def get_measurements_history(self, user_id: Optional[str] = None, all_users: bool = False) -> List[MeasurementDetail]:
+        """
+        Fetch the complete measurement history, newest first, one page at a time.
+
+        Prefer ``iter_measurement_pages`` for large accounts; this collects every page.
+        """
+        history = []
+        async for page in self.iter_measurement_pages(user_id=user_id, all_users=all_users):
+            history.extend(page)
+        history.sort(key=lambda record: record.time_stamp, reverse=True)
+        return history
+
+    def _notify_sync_update(self):
+        if self.on_sync_update is not None:
+            self.on_sync_update()
+
+    def sync_state(self) -> Dict:
+        """
+        Return the sync cursors in a JSON serializable form.
+
+        Includes the newest raw measurement so ``weight_info`` is available right
+        after a restart, before the first incremental sync.
+        """
+        return {
+            "user_id": self._history_user_id,
+            "measurements": {
+                user_key: {
+                    "cursor": cursor,
+                    "last_full_sync": self._last_full_sync.get(user_key),
+                }
+                for user_key, cursor in self._measurement_cursors.items()
+            },
+            "latest_measurement": self._latest_measurement_payload,
+            "backfill": dict(self._backfill_checkpoints),
+            **{
+                metric_type: {
+                    user_key: {
+                        "cursor": cursor,
+                        "last_full_sync": self._watermark_full_sync[metric_type].get(user_key),
+                    }
+                    for user_key, cursor in watermarks.items()
+                }
+                for metric_type, watermarks in self._watermarks.items()
+            },
+        }
+
+    def restore_sync_state(self, data: Optional[Dict]) -> bool:
+        """Restore sync cursors saved by ``sync_state``. Returns True if a cursor was restored."""
+        if not data:
+            return False
+
+        for user_key, state in (data.get("measurements") or {}).items():
+            if state.get("cursor") is not None:
+                self._measurement_cursors[user_key] = state["cursor"]
+            if state.get("last_full_sync") is not None:
+                self._last_full_sync[user_key] = state["last_full_sync"]
+
+        self._backfill_checkpoints.update(data.get("backfill") or {})
+
+        for metric_type, watermarks in self._watermarks.items():
+            for user_key, state in (data.get(metric_type) or {}).items():
+                if state.get("cursor") is not None:
+                    watermarks[user_key] = state["cursor"]
+                if state.get("last_full_sync") is not None:
+                    self._watermark_full_sync[metric_type][user_key] = state["last_full_sync"]
+
+        user_key = data.get("user_id")
+        latest = data.get("latest_measurement")
+        if latest and user_key is not None and user_key in self._measurement_cursors:
+            try:
+                self._merge_measurements(user_key, [latest], replace=True, persist=False)
+            except Exception as e:
+                _LOGGER.warning(f"Stored Renpho measurement could not be restored: {e}")
+                return False
+        return bool(self._measurement_cursors)
+
     async def get_weight(self):
         if self.weight and self.weight_info:
             return self.weight, self.weight_info
@@ -384,9 +955,9 @@ class RenphoWeight:
         """
         Fetch device information and update the class attribute with device bind details.
         """
-        url = f"{DEVICE_INFO_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        url = f"{DEVICE_INFO_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch device info.")
@@ -412,9 +983,12 @@ class RenphoWeight:
         """
         Fetch the latest model for the user.
         """
-        url = f"{LATEST_MODEL_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}$internal_model_json=%5B%22{self.weight_info.internal_model}%22%5D"
+        if self.weight_info is None:
+            _LOGGER.debug("Latest model needs the scale model of a measurement. Skipping.")
+            return None
+        url = f"{LATEST_MODEL_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&internal_model_json=%5B%22{self.weight_info.internal_model}%22%5D"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch latest model.")
@@ -430,19 +1004,81 @@ class RenphoWeight:
             _LOGGER.error(f"Failed to fetch latest model: {e}")
             return None
 
+    def _watermark_since(self, metric_type: str, records) -> Optional[int]:
+        """
+        Return the ``last_updated_at`` to request for an incremental sync, or None for a full sync.
+
+        A full sync runs when there is no watermark or local collection for the
+        current user, and every ``full_sync_interval`` seconds to reconcile deletions.
+        """
+        user_key = str(self.user_id)
+        watermark = self._watermarks[metric_type].get(user_key)
+        if (
+            watermark is None
+            or records is None
+            or self._watermark_user_id[metric_type] != user_key
+            or time.time() - self._watermark_full_sync[metric_type].get(user_key, 0) >= self.full_sync_interval
+        ):
+            return None
+        return watermark
+
+    def _advance_watermark(self, metric_type: str, watermark: Optional[int], full_sync: bool):
+        user_key = str(self.user_id)
+        self._watermark_user_id[metric_type] = user_key
+        changed = full_sync
+        if full_sync:
+            self._watermark_full_sync[metric_type][user_key] = time.time()
+        if watermark and watermark > self._watermarks[metric_type].get(user_key, 0):
+            self._watermarks[metric_type][user_key] = watermark
+            changed = True
+        if changed:
+            self._notify_sync_update()
+
     async def list_girth(self):
-        url = f"{GIRTH_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        """
+        Fetch the girth records changed since the user's watermark and merge them by ``girth_id``.
+        """
+        since = self._watermark_since(METRIC_TYPE_GIRTH, self.girth_info)
+        full_sync = since is None
+        last_updated_at = self.get_timestamp() if full_sync else since
+
+        url = f"{GIRTH_URL}?user_id={self.user_id}&last_updated_at={last_updated_at}&locale=en&app_id=Renpho"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch girth info.")
                 return None
 
             if "status_code" in parsed and parsed["status_code"] == "20000":
-                response = GirthResponse(**parsed)
+                # The girths are built by the record factory; only the envelope is validated here
+                response = GirthResponse(**{**parsed, "girths": []})
+                new_girths = self._girth_factory.build_many(parsed["girths"])
+                deleted = set(response.deleted_girth_ids)
+                self._girth_factory.forget(deleted)
+                if self.measurement_store is not None and self.user_id is not None:
+                    if full_sync:
+                        self.measurement_store.queue_replace(METRIC_TYPE_GIRTH, self.user_id, parsed["girths"])
+                    else:
+                        self.measurement_store.queue_upsert(METRIC_TYPE_GIRTH, parsed["girths"])
+                    self.measurement_store.queue_delete(METRIC_TYPE_GIRTH, deleted)
+
+                girths = {} if full_sync else {girth.girth_id: girth for girth in self.girth_info}
+                girths.update((girth.girth_id, girth) for girth in new_girths)
+                for girth_id in deleted:
+                    girths.pop(girth_id, None)
+
                 self._last_updated_girth = time.time()
-                self.girth_info = response.girths
+                self.girth_info = sorted(girths.values(), key=lambda girth: girth.time_stamp, reverse=True)
+                if full_sync:
+                    self.girth_index.rebuild(self.girth_info)
+                else:
+                    self.girth_index.merge(new_girths, deleted, self.girth_info)
+                self._advance_watermark(
+                    METRIC_TYPE_GIRTH,
+                    response.last_updated_at or max((girth.updated_at for girth in new_girths), default=None),
+                    full_sync,
+                )
                 return self.girth_info
             else:
                 _LOGGER.error(f"Error fetching girth info: {parsed.get('status_message')}")
@@ -454,11 +1090,17 @@ class RenphoWeight:
 
     async def list_girth_goal(self):
         """
-        Fetch the girth goal for the user.
+        Fetch the girth goals changed since the user's watermark and merge them by ``girth_goal_id``.
+
+        The endpoint does not report deleted goals; they are dropped by the periodic full sync.
         """
-        url = f"{GIRTH_GOAL_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        since = self._watermark_since(METRIC_TYPE_GIRTH_GOAL, self.girth_goal)
+        full_sync = since is None
+        last_updated_at = self.get_timestamp() if full_sync else since
+
+        url = f"{GIRTH_GOAL_URL}?user_id={self.user_id}&last_updated_at={last_updated_at}&locale=en&app_id=Renpho"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch girth goal.")
@@ -466,8 +1108,28 @@ class RenphoWeight:
 
             if "status_code" in parsed and parsed["status_code"] == "20000":
                 response = GirthGoalsResponse(**parsed)
-                self.girth_goal = response.girth_goals
+                if self.measurement_store is not None and self.user_id is not None:
+                    if full_sync:
+                        self.measurement_store.queue_replace(METRIC_TYPE_GIRTH_GOAL, self.user_id, parsed["girth_goals"])
+                    else:
+                        self.measurement_store.queue_upsert(METRIC_TYPE_GIRTH_GOAL, parsed["girth_goals"])
+
+                goals = {} if full_sync else {goal.girth_goal_id: goal for goal in self.girth_goal}
+                goals.update((goal.girth_goal_id, goal) for goal in response.girth_goals)
+
+                self.girth_goal = sorted(goals.values(), key=lambda goal: goal.setup_goal_at, reverse=True)
+                if full_sync:
+                    self.girth_goal_index.rebuild(self.girth_goal)
+                else:
+                    self.girth_goal_index.merge(response.girth_goals, self.girth_goal)
                 self._last_updated_girth_goal = time.time()
+                self._advance_watermark(
+                    METRIC_TYPE_GIRTH_GOAL,
+                    parsed.get("last_updated_at") or max(
+                        (max(goal.setup_goal_at, goal.finish_goal_at) for goal in response.girth_goals), default=None
+                    ),
+                    full_sync,
+                )
                 return self.girth_goal
             else:
                 _LOGGER.error(f"Error fetching girth goal: {parsed.get('status_message')}")
@@ -481,9 +1143,9 @@ class RenphoWeight:
         Fetch the growth record for the user.
         """
 
-        url = f"{GROWTH_RECORD_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        url = f"{GROWTH_RECORD_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch growth record.")
@@ -504,9 +1166,9 @@ class RenphoWeight:
         """
         Asynchronously list messages.
         """
-        url = f"{MESSAGE_LIST_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        url = f"{MESSAGE_LIST_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to fetch messages.")
@@ -524,9 +1186,9 @@ class RenphoWeight:
         """
         Asynchronously request user
         """
-        url = f"{USER_REQUEST_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        url = f"{USER_REQUEST_URL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to request user.")
@@ -545,9 +1207,9 @@ class RenphoWeight:
         Asynchronously reach goal
         """
 
-        url = f"{USERS_REACH_GOAL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho&terminal_user_session_key={self.token}"
+        url = f"{USERS_REACH_GOAL}?user_id={self.user_id}&last_updated_at={self.get_timestamp()}&locale=en&app_id=Renpho"
         try:
-            parsed = await self._request("GET", url, skip_auth=True)
+            parsed = await self._request("GET", url)
 
             if not parsed:
                 _LOGGER.error("Failed to reach goal.")
@@ -584,23 +1246,13 @@ class RenphoWeight:
             elif metric_type == METRIC_TYPE_GIRTH:
                 if self._last_updated_girth is None or self.girth_info is None:
                     await self.list_girth()
-                if self.girth_info:
-                    valid_girths = sorted([g for g in self.girth_info if getattr(g, f"{metric}_value", 0) not in (None, 0.0)], key=lambda x: x.time_stamp, reverse=True)
-                    for girth in valid_girths:
-                        value = getattr(girth, f"{metric}_value", None)
-                        if value not in (None, 0.0):
-                            return value
-                    return None
+                latest = self.girth_index.latest(metric)
+                return latest.value if latest is not None else None
             elif metric_type == METRIC_TYPE_GIRTH_GOAL:
                 if self._last_updated_girth_goal is None or self.girth_goal is None:
                     await self.list_girth_goal()
-                if self.girth_goal:
-                    valid_goals = sorted([g for g in self.girth_goal if g.girth_type == metric and g.goal_value not in (None, 0.0)], key=lambda x: x.setup_goal_at, reverse=True)
-                    # Iterate to find the first valid goal
-                    for goal in valid_goals:
-                        if goal.goal_value not in (None, 0.0):
-                            return goal.goal_value
-                    return None
+                goal = self.girth_goal_index.latest(metric)
+                return goal.goal_value if goal is not None else None
             else:
                 _LOGGER.error(f"Invalid metric type: {metric_type}")
                 return None
@@ -608,18 +1260,90 @@ class RenphoWeight:
             _LOGGER.error(f"Failed to fetch specific metric: {e}")
             return None
 
+    @property
+    def refresh_endpoints(self) -> Dict[str, Callable[[], Awaitable]]:
+        """Return the independent endpoint fetches that make up a refresh."""
+        return {
+            METRIC_TYPE_WEIGHT: self.get_measurements,
+            METRIC_TYPE_GIRTH: self.list_girth,
+            METRIC_TYPE_GIRTH_GOAL: self.list_girth_goal,
+            ENDPOINT_DEVICE_INFO: self.get_device_info,
+            ENDPOINT_LATEST_MODEL: self.list_latest_model,
+        }
+
+    async def fetch_concurrently(
+        self,
+        endpoints: Dict[str, Callable[[], Awaitable]],
+        max_concurrency: int = DEFAULT_REFRESH_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_ENDPOINT_TIMEOUT,
+    ) -> Dict[str, object]:
+        """
+        Run independent endpoint fetches concurrently.
+
+        At most ``max_concurrency`` fetches run at once. A fetch still running
+        ``timeout`` seconds after this call started is cancelled, including time it
+        spent waiting for its turn, so every result is in after ``timeout`` seconds.
+        A failing fetch does not affect the others.
+
+        Returns:
+            Dict[str, object]: The result of each fetch by name, or the exception it raised.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        async def run(name: str, fetch: Callable[[], Awaitable]):
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    remaining = deadline - start if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    result = await asyncio.wait_for(fetch(), remaining)
+                except Exception as e:
+                    self.last_refresh[name] = {"ok": False, "duration": round(time.monotonic() - start, 3), "error": describe_error(e)}
+                    raise
+                self.last_refresh[name] = {"ok": result is not None, "duration": round(time.monotonic() - start, 3)}
+                return result
+
+        results = await asyncio.gather(*(run(name, fetch) for name, fetch in endpoints.items()), return_exceptions=True)
+        return dict(zip(endpoints, results))
+
+    async def refresh_data(
+        self,
+        endpoints: Optional[List[str]] = None,
+        max_concurrency: int = DEFAULT_REFRESH_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_ENDPOINT_TIMEOUT,
+    ) -> Dict[str, object]:
+        """
+        Fetch refresh endpoints concurrently and return the per-endpoint results.
+
+        Parameters:
+            endpoints (Optional[List[str]]): Names from ``refresh_endpoints`` to fetch. Defaults to all.
+
+        A fetch that failed has ``None`` or its exception as result; the data of the
+        successful fetches is applied regardless.
+        """
+        fetches = self.refresh_endpoints
+        if endpoints is not None:
+            fetches = {name: fetches[name] for name in endpoints if name in fetches}
+        if not fetches:
+            return {}
+        if self.user_id is None:
+            # Every endpoint needs the user id, which the sign-in provides.
+            await self._token_manager.async_get_token()
+        return await self.fetch_concurrently(fetches, max_concurrency=max_concurrency, timeout=timeout)
+
     async def poll_data(self):
         """
         The core polling logic that fetches data and processes it.
         """
         try:
-            asyncio.gather(
-                await self.get_info(),
-                await self.list_girth(),
-                await self.list_girth_goal(),
-            )
-
-            _LOGGER.info("Data fetched successfully.")
+            results = await self.refresh_data()
+            failed = [name for name, result in results.items() if result is None or isinstance(result, Exception)]
+            if failed:
+                _LOGGER.warning(f"Data fetched partially. Failed endpoints: {', '.join(failed)}")
+            else:
+                _LOGGER.info("Data fetched successfully.")
         except Exception as e:
             _LOGGER.error(f"Error fetching data: {e}")
 
@@ -667,10 +1391,18 @@ class RenphoWeight:
         """
         Clean up resources, stop polling, and close sessions.
         """
-        self.stop_polling()
-        if self.session:
+        if self.is_polling_active:
+            self.stop_polling()
+        self.proxy_health.stop()
+        # Requests abandoned by a timed out refresh keep running until cancelled
+        for task in list(self._inflight_requests.values()):
+            task.cancel()
+        if self.session and not self.session.closed:
             await self.session.close()
             _LOGGER.info("Aiohttp session closed")
+        self.session = None
+        if self.measurement_store is not None:
+            await self.measurement_store.async_close()
 
 class AuthenticationError(Exception):
     pass
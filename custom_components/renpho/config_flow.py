@@ -5,13 +5,19 @@ from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries, exceptions
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from homeassistant.helpers import translation
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_EMAIL,
     CONF_PASSWORD,
+    CONF_PROXY,
+    CONF_PROXY_CIRCUIT_BREAKER,
+    CONF_PROXY_FAILURE_THRESHOLD,
+    CONF_PROXY_HEALTH_TTL,
+    CONF_PROXY_RECOVERY_INTERVAL,
     CONF_PUBLIC_KEY,
     CONF_REFRESH,
     CONF_UNIT_OF_MEASUREMENT,
@@ -21,6 +27,7 @@ from .const import (
     MASS_POUNDS,
 )
 from .api_renpho import RenphoWeight
+from .proxy_health import DEFAULT_FAILURE_THRESHOLD, DEFAULT_PROXY_HEALTH_TTL, DEFAULT_RECOVERY_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,7 +36,8 @@ DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_PASSWORD): str,
     vol.Optional(CONF_REFRESH, default=60): int,
     vol.Optional(CONF_UNIT_OF_MEASUREMENT, default=MASS_KILOGRAMS): vol.In([MASS_KILOGRAMS, MASS_POUNDS]),
-    vol.Optional("proxy"): str
+    vol.Optional(CONF_PROXY): str,
+    vol.Optional(CONF_ADAPTIVE_POLLING, default=False): bool,
 })
 
 async def async_validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any]:
@@ -41,9 +49,17 @@ async def async_validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any
         email=data[CONF_EMAIL],
         password=data[CONF_PASSWORD],
         refresh=data.get(CONF_REFRESH, 60),
-        proxy=data.get("proxy", None)
+        proxy=data.get(CONF_PROXY, None)
     )
 
+    try:
+        return await _async_validate_with(renpho, data)
+    finally:
+        await renpho.close()
+
+
+async def _async_validate_with(renpho: RenphoWeight, data: dict) -> dict[str, Any]:
+    """Run the validation steps against an already created RenphoWeight instance."""
     # Check if a proxy is set and validate it
     if renpho.proxy:
         _LOGGER.info(f"Proxy is configured, checking proxy: {renpho.proxy}")
@@ -83,10 +99,31 @@ async def async_validate_input(hass: HomeAssistant, data: dict) -> dict[str, Any
     return {"title": data[CONF_EMAIL], "user_ids": user_ids, "renpho_instance": renpho}
 
 
+def options_schema(options: dict) -> vol.Schema:
+    """Return the proxy health options, defaulting to the current ``options``."""
+    return vol.Schema({
+        vol.Optional(CONF_PROXY_CIRCUIT_BREAKER, default=options.get(CONF_PROXY_CIRCUIT_BREAKER, False)): bool,
+        vol.Optional(
+            CONF_PROXY_FAILURE_THRESHOLD, default=options.get(CONF_PROXY_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD)
+        ): vol.All(int, vol.Range(min=1)),
+        vol.Optional(
+            CONF_PROXY_RECOVERY_INTERVAL, default=options.get(CONF_PROXY_RECOVERY_INTERVAL, DEFAULT_RECOVERY_INTERVAL)
+        ): vol.All(int, vol.Range(min=1)),
+        vol.Optional(
+            CONF_PROXY_HEALTH_TTL, default=options.get(CONF_PROXY_HEALTH_TTL, DEFAULT_PROXY_HEALTH_TTL)
+        ): vol.All(int, vol.Range(min=0)),
+    })
+
+
 class RenphoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return RenphoOptionsFlow({**config_entry.data, **config_entry.options})
+
     async def async_step_user(self, user_input=None):
         errors = {}
         if user_input is not None:
@@ -133,6 +170,19 @@ class RenphoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"additional_info": "Please select your User ID."}
         )
 
+class RenphoOptionsFlow(config_entries.OptionsFlow):
+    """Tune how a configured proxy is health checked; the entry reloads with the new options."""
+
+    def __init__(self, options: dict):
+        self._options = options
+
+    async def async_step_init(self, user_input=None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(step_id="init", data_schema=options_schema(self._options))
+
+
 class CannotConnect(exceptions.HomeAssistantError):
     def __init__(self, reason: str = "", details: dict = None):
         super().__init__()
@@ -4,6 +4,7 @@
 from typing import Final
 
 DOMAIN: Final = "renpho"
+DATA_COORDINATOR: Final = "renpho_coordinator"  # hass.data key of the sensor coordinator
 VERSION: Final = "1.0.0"
 EVENT_HOMEASSISTANT_CLOSE: Final = "homeassistant_close"
 EVENT_HOMEASSISTANT_START: Final = "homeassistant_start"
@@ -13,6 +14,15 @@ MASS_KILOGRAMS: Final = "kg"
 MASS_POUNDS: Final = "lbs"
 TIME_SECONDS: Final = "s"
 
+# Storage
+SESSION_STORAGE_KEY: Final = "renpho.session"  # Persisted session key and sign-in metadata
+SESSION_STORAGE_VERSION: Final = 1
+SESSION_SAVE_DELAY: Final = 1  # Seconds to batch session writes
+SYNC_STORAGE_KEY: Final = "renpho.sync"  # Persisted incremental sync cursors
+SYNC_STORAGE_VERSION: Final = 1
+SYNC_SAVE_DELAY: Final = 10  # Seconds to batch sync cursor writes
+MEASUREMENT_DB_FILENAME: Final = "renpho.db"  # SQLite store for measurement history, in .storage
+
 
 # Configuration keys
 CONF_EMAIL: Final = "email"  # The email used for Renpho login
@@ -23,6 +33,20 @@ CONF_USER_ID: Final = (
     "user_id"  # The ID of the user for whom weight data should be fetched
 )
 CONF_UNIT_OF_MEASUREMENT = "unit_of_measurement"
+CONF_PROXY: Final = "proxy"  # Optional proxy URL for all Renpho requests
+CONF_PROXY_CIRCUIT_BREAKER: Final = (
+    "proxy_circuit_breaker"  # Detect failing proxies in the background instead of per request
+)
+CONF_PROXY_FAILURE_THRESHOLD: Final = (
+    "proxy_failure_threshold"  # Consecutive proxy failures before the circuit opens
+)
+CONF_PROXY_RECOVERY_INTERVAL: Final = (
+    "proxy_recovery_interval"  # Seconds before an open circuit first re-checks the proxy
+)
+CONF_PROXY_HEALTH_TTL: Final = "proxy_health_ttl"  # Seconds a failed proxy check is trusted
+CONF_ADAPTIVE_POLLING: Final = (
+    "adaptive_polling"  # Poll often around usual weigh-in times and back off in between
+)
 
 KG_TO_LBS: Final = 2.2046226218
 CM_TO_INCH: Final = 0.393701
@@ -130,6 +154,15 @@ METRIC_TYPE = [
     METRIC_TYPE_GIRTH_GOAL,
 ]
 
+# Refreshed endpoints besides the metric types, and their refresh intervals in seconds.
+# Measurements follow CONF_REFRESH.
+ENDPOINT_DEVICE_INFO: Final = "device_info"
+ENDPOINT_LATEST_MODEL: Final = "latest_model"
+GIRTH_REFRESH_INTERVAL: Final = 60 * 60
+GIRTH_GOAL_REFRESH_INTERVAL: Final = 24 * 60 * 60
+DEVICE_INFO_REFRESH_INTERVAL: Final = 24 * 60 * 60
+LATEST_MODEL_REFRESH_INTERVAL: Final = 24 * 60 * 60
+
 # Public key for encrypting the password
 CONF_PUBLIC_KEY: Final = """-----BEGIN PUBLIC KEY-----
 MIGfMA0GCSqGSIb3DQEBAQUAA4GNADCBiQKBgQC+25I2upukpfQ7rIaaTZtVE744
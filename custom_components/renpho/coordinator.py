@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 import logging
+import time
 
 import async_timeout
 from homeassistant.helpers.update_coordinator import (
@@ -10,16 +11,44 @@ from homeassistant.helpers.update_coordinator import (
 
 import asyncio
 
-from .const import CONF_EMAIL, CONF_REFRESH, CONF_USER_ID, DOMAIN, CONF_UNIT_OF_MEASUREMENT
+from .adaptive_polling import AdaptivePolling
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_EMAIL,
+    CONF_REFRESH,
+    CONF_UNIT_OF_MEASUREMENT,
+    CONF_USER_ID,
+    DATA_COORDINATOR,
+    DEVICE_INFO_REFRESH_INTERVAL,
+    DOMAIN,
+    ENDPOINT_DEVICE_INFO,
+    ENDPOINT_LATEST_MODEL,
+    GIRTH_GOAL_REFRESH_INTERVAL,
+    GIRTH_REFRESH_INTERVAL,
+    LATEST_MODEL_REFRESH_INTERVAL,
+    METRIC_TYPE_GIRTH,
+    METRIC_TYPE_GIRTH_GOAL,
+    METRIC_TYPE_WEIGHT,
+)
+from .refresh_scheduler import RefreshScheduler
+from .sensor_configs import sensor_configurations
+from .snapshot import MetricSnapshot, build_snapshot
+from .statistics import StatisticsImporter
 
 _LOGGER = logging.getLogger(__name__)
 
+# Share of the refresh budget endpoint fetches and their retries may use, so they time out
+# before the refresh itself and the endpoints that did answer are still published
+ENDPOINT_BUDGET_SHARE = 0.8
+
 def create_coordinator(hass, api, config):
     """Create the data update coordinator."""
-    return RenphoWeightCoordinator(hass=hass, api=api, config=config)
+    coordinator = RenphoWeightCoordinator(hass=hass, api=api, config=config)
+    hass.data[DATA_COORDINATOR] = coordinator
+    return coordinator
 
 
-class RenphoWeightCoordinator(DataUpdateCoordinator):
+class RenphoWeightCoordinator(DataUpdateCoordinator[MetricSnapshot]):
     """Class to manage fetching data from the API."""
 
     def __init__(self, hass, api, config):
@@ -33,6 +62,19 @@ class RenphoWeightCoordinator(DataUpdateCoordinator):
         self._email = hass.data[CONF_EMAIL]
         self._data = {}
         self._last_updated = None
+        # Slow-changing endpoints are refreshed less often; never more often than measurements
+        self.scheduler = RefreshScheduler({
+            METRIC_TYPE_WEIGHT: self._refresh,
+            METRIC_TYPE_GIRTH: max(self._refresh, GIRTH_REFRESH_INTERVAL),
+            METRIC_TYPE_GIRTH_GOAL: max(self._refresh, GIRTH_GOAL_REFRESH_INTERVAL),
+            ENDPOINT_DEVICE_INFO: max(self._refresh, DEVICE_INFO_REFRESH_INTERVAL),
+            ENDPOINT_LATEST_MODEL: max(self._refresh, LATEST_MODEL_REFRESH_INTERVAL),
+        })
+        self.adaptive_polling = AdaptivePolling(self._refresh) if hass.data.get(CONF_ADAPTIVE_POLLING) else None
+        self._learned_history_size = None
+        # Sensor state writes, and writes skipped because the value did not change
+        self.state_writes = {"written": 0, "suppressed": 0}
+        self.statistics = StatisticsImporter(hass, api, self._unit_of_measurement)
 
         super().__init__(
             hass, _LOGGER, name=DOMAIN, update_interval=timedelta(seconds=self._refresh)
@@ -40,22 +82,66 @@ class RenphoWeightCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         """Fetch data from API."""
+        # Retries must not outlive the refresh they belong to
+        self.api.set_refresh_deadline(self._refresh * ENDPOINT_BUDGET_SHARE)
         try:
-            with async_timeout.timeout(self._refresh):
-                await self.api.get_measurements()
-                await self.api.list_girth()
-                await self.api.list_girth_goal()
+            async with async_timeout.timeout(self._refresh):
+                # Measurements are fetched on every tick, including manual refreshes; other
+                # endpoints are skipped until due. The latest model needs the scale model of
+                # a measurement, so it waits for one.
+                now = time.monotonic()
+                previous_time_stamp = self.api.weight_info.time_stamp if self.api.weight_info else None
+                due = [
+                    name for name in self.scheduler.due(now)
+                    if name != METRIC_TYPE_WEIGHT
+                    and (name != ENDPOINT_LATEST_MODEL or self.api.weight_info is not None)
+                ]
+                due.insert(0, METRIC_TYPE_WEIGHT)
+                results = await self.api.refresh_data(due, timeout=self._refresh * ENDPOINT_BUDGET_SHARE)
+
+            failed = [name for name, result in results.items() if result is None or isinstance(result, Exception)]
+            for name in results:
+                self.scheduler.record(name, name not in failed, now)
+            if results and len(failed) == len(results):
+                raise UpdateFailed(f"Error fetching data from every endpoint: {', '.join(failed)}")
+            if failed:
+                # Publish what was fetched; the failed endpoints keep their previous data
+                _LOGGER.warning(f"Partial refresh from Renpho API. Failed endpoints: {', '.join(failed)}")
+            if stale := self.scheduler.stale():
+                _LOGGER.warning(f"Renpho data is stale for: {', '.join(stale)}")
+            if self.adaptive_polling is not None:
+                self._adapt_update_interval(previous_time_stamp)
+            if any(name in results and name not in failed for name in (METRIC_TYPE_WEIGHT, METRIC_TYPE_GIRTH)):
+                # Backfill and extend the long-term statistics without delaying the refresh
+                self.hass.async_create_task(self.statistics.async_import())
 
             self._last_updated = datetime.now()
+            # Sensors read their state from this snapshot, so it is published as coordinator.data
+            return build_snapshot(self.api, sensor_configurations, self._unit_of_measurement)
         except asyncio.TimeoutError:
             _LOGGER.error("Timeout error fetching data from Renpho API.")
             raise UpdateFailed("Timeout error occurred while fetching data.")
+        except UpdateFailed:
+            raise
         except asyncio.CancelledError:
             _LOGGER.error("Task was cancelled, possibly during shutdown.")
             # Don't raise UpdateFailed for CancelledError as it's a normal part of operation
         except Exception as e:
             _LOGGER.error(f"Error fetching data from Renpho API: {e}")
             raise UpdateFailed(f"Error fetching data: {e}") from e
+        finally:
+            self.api.set_refresh_deadline(None)
+
+    def _adapt_update_interval(self, previous_time_stamp):
+        """Set the delay until the next refresh from the learned weigh-in windows."""
+        history = self.api.weight_history
+        if len(history) != self._learned_history_size:
+            self.adaptive_polling.learn(history.iter_rows("time_stamp", "time_zone"))
+            self._learned_history_size = len(history)
+
+        time_stamp = self.api.weight_info.time_stamp if self.api.weight_info else None
+        interval = self.adaptive_polling.next_interval(time.time(), time_stamp != previous_time_stamp)
+        self.update_interval = timedelta(seconds=interval)
 
     @property
     def last_updated(self):
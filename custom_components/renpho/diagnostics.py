@@ -0,0 +1,42 @@
+"""Diagnostics support for the Renpho integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_EMAIL, CONF_PASSWORD, CONF_PROXY, CONF_USER_ID, DATA_COORDINATOR, DOMAIN
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, CONF_PROXY, CONF_USER_ID}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    api = hass.data.get(DOMAIN)
+    coordinator = hass.data.get(DATA_COORDINATOR)
+
+    diagnostics: dict[str, Any] = {"entry": async_redact_data(dict(entry.data), TO_REDACT)}
+    if api is not None:
+        diagnostics["api"] = {
+            "token": api.token_status,
+            "proxy": api.proxy_status,
+            "requests": api.request_stats,
+            "retries": api.retry_policy.as_dict(),
+            "last_refresh": api.last_refresh,
+            "measurements": api.weight_history.as_dict(),
+            "measurement_store": api.measurement_store.stats if api.measurement_store is not None else None,
+        }
+    if coordinator is not None:
+        diagnostics["coordinator"] = {
+            "last_update_success": coordinator.last_update_success,
+            "schedule": coordinator.scheduler.as_dict(),
+            "adaptive_polling": (
+                coordinator.adaptive_polling.as_dict() if coordinator.adaptive_polling is not None else None
+            ),
+            "state_writes": coordinator.state_writes,
+            "statistics": coordinator.statistics.as_dict(),
+        }
+    return diagnostics
@@ -0,0 +1,343 @@
+"""Columnar in-memory history of Renpho measurements."""
+
+import array
+import bisect
+import math
+import operator
+import sys
+from collections import namedtuple
+from typing import Any, Dict, Final, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union, get_args
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .api_object import MeasurementDetail
+
+_NONE_TYPE = type(None)
+
+
+def _column_kind(annotation) -> str:
+    types = get_args(annotation) or (annotation,)
+    if str in types:
+        return "text"
+    if float in types or _NONE_TYPE in types:
+        # Missing values are stored as NaN, so nullable integers need a float column
+        return "float"
+    return "int"
+
+
+MEASUREMENT_FIELDS: Final = tuple(MeasurementDetail.__annotations__)
+COLUMN_KINDS: Final = {field: _column_kind(annotation) for field, annotation in MeasurementDetail.__annotations__.items()}
+NUMERIC_FIELDS: Final = tuple(field for field, kind in COLUMN_KINDS.items() if kind != "text")
+# Optional integer fields held in float columns, turned back into int when a record is rebuilt
+_NULLABLE_INT_FIELDS: Final = frozenset(
+    field for field, annotation in MeasurementDetail.__annotations__.items()
+    if COLUMN_KINDS[field] == "float" and int in get_args(annotation)
+)
+_TYPECODES: Final = {"int": "q", "float": "d"}
+_NAN: Final = float("nan")
+_KIND_FIELDS: Final = {kind: tuple(field for field in MEASUREMENT_FIELDS if COLUMN_KINDS[field] == kind) for kind in ("int", "float", "text")}
+_get_fields: Final = operator.itemgetter(*MEASUREMENT_FIELDS)
+_get_kind_fields: Final = {kind: operator.itemgetter(*fields) for kind, fields in _KIND_FIELDS.items()}
+
+
+def payload_digest(data: Mapping[str, Any]) -> Optional[int]:
+    """Return a hash of the model fields of a raw or parsed measurement, or None if it has unhashable values."""
+    try:
+        try:
+            return hash(_get_fields(data))
+        except KeyError:
+            return hash(tuple(data.get(field) for field in MEASUREMENT_FIELDS))
+    except TypeError:
+        return None
+
+
+class MeasurementHistory:
+    """
+    Measurement history stored column by column.
+
+    Every numeric ``MeasurementDetail`` field, including ``id``, ``b_user_id`` and
+    ``time_stamp``, is kept in a typed ``array`` (8 bytes per value, NaN for
+    missing values) and text fields in lists of interned strings, instead of one
+    pydantic object per measurement. Rows are ordered by ``time_stamp``, oldest
+    first, so a new measurement is appended in O(1) and time ranges are found by
+    bisection. An index from record id to row finds known records without a scan.
+
+    ``column``, ``aggregate`` and ``hourly`` work on whole columns and use numpy
+    when it is installed. For compatibility with the former list of records the
+    history is also a sequence of ``MeasurementDetail``, newest first; records are
+    rebuilt on access, so prefer the column methods for anything but a few rows.
+    """
+
+    def __init__(self):
+        """Initialize an empty history."""
+        self._clear()
+        self.validated = 0
+
+    def _clear(self):
+        self._columns: Dict[str, Union[array.array, list]] = {
+            field: [] if kind == "text" else array.array(_TYPECODES[kind]) for field, kind in COLUMN_KINDS.items()
+        }
+        self._digests = array.array("q")
+        self._strings: Dict[str, str] = {}
+        self._positions: Dict[int, int] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[MeasurementDetail]) -> "MeasurementHistory":
+        """Build a history from parsed records in any order."""
+        history = cls()
+        rows = [(values, payload_digest(values)) for values in map(vars, records)]
+        history._extend(sorted(rows, key=lambda row: row[0]["time_stamp"]))
+        return history
+
+    # ------------------- Writes -------------------
+
+    def _extend(self, rows: List[Tuple[Mapping[str, Any], Optional[int]]]):
+        """Append rows column by column; every row must hold all fields, as the fields of a parsed record do."""
+        if not rows:
+            return
+        records = [values for values, _ in rows]
+        self._positions.update((values["id"], position) for position, values in enumerate(records, len(self)))
+        intern = self._strings.setdefault
+        for kind, fields in _KIND_FIELDS.items():
+            for field, values in zip(fields, zip(*map(_get_kind_fields[kind], records))):
+                if kind == "float":
+                    values = [_NAN if value is None else value for value in values]
+                elif kind == "text":
+                    values = [value if value is None else intern(value, value) for value in values]
+                self._columns[field].extend(values)
+        self._digests.extend(0 if digest is None else digest for _, digest in rows)
+
+    def _set(self, position: int, values: Mapping[str, Any], digest: Optional[int]):
+        strings = self._strings
+        for field, kind in COLUMN_KINDS.items():
+            value = values.get(field)
+            if kind == "text":
+                self._columns[field][position] = strings.setdefault(value, value) if value is not None else None
+            elif kind == "float":
+                self._columns[field][position] = _NAN if value is None else value
+            else:
+                self._columns[field][position] = value
+        self._digests[position] = digest if digest is not None else 0
+
+    def merge(self, measurements: List[Dict], replace: bool = False) -> int:
+        """
+        Merge raw API measurements and return how many records were added, changed or removed.
+
+        Records whose id is already held with the same field values are skipped
+        without validation; the others are validated and inserted or updated in
+        place. With ``replace`` records missing from ``measurements`` are removed.
+        """
+        positions = self._positions
+        updates: Dict[Any, Tuple[Dict[str, Any], Optional[int]]] = {}
+        seen: Set[int] = set()
+        for data in measurements:
+            digest = payload_digest(data)
+            position = positions.get(data.get("id"))
+            seen.add(data.get("id"))
+            if position is not None and digest is not None and self._digests[position] == digest:
+                continue
+            values = vars(MeasurementDetail(**data))
+            updates[values["id"]] = (values, payload_digest(values))
+        changed = list(updates.values())
+        removed = set(positions) - seen if replace else set()
+        if not changed and not removed:
+            return 0
+        self.validated += len(changed)
+
+        time_stamps = self._columns["time_stamp"]
+        in_order = not removed
+        for values, _ in changed:
+            position = positions.get(values["id"])
+            if position is not None:
+                in_order = in_order and time_stamps[position] == values["time_stamp"]
+            else:
+                in_order = in_order and (not time_stamps or values["time_stamp"] >= time_stamps[-1])
+        if in_order:
+            added = []
+            for values, digest in changed:
+                position = positions.get(values["id"])
+                if position is not None:
+                    self._set(position, values, digest)
+                else:
+                    added.append((values, digest))
+            self._extend(sorted(added, key=lambda row: row[0]["time_stamp"]))
+            return len(changed)
+
+        # An older record was added, a timestamp was edited or records were deleted: rebuild in order
+        rows = [
+            (self._raw_row(position), self._digests[position])
+            for record_id, position in sorted(positions.items(), key=lambda item: item[1])
+            if record_id not in updates and record_id not in removed
+        ]
+        rows.extend(changed)
+        rows.sort(key=lambda row: row[0]["time_stamp"])
+        self._clear()
+        self._extend(rows)
+        return len(changed) + len(removed)
+
+    # ------------------- Records -------------------
+
+    def _raw_row(self, position: int) -> Dict[str, Any]:
+        return {field: column[position] for field, column in self._columns.items()}
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """Return the fields of the row at ``position`` (oldest first), with None for missing values."""
+        values = self._raw_row(position)
+        for field, kind in COLUMN_KINDS.items():
+            if kind == "float":
+                value = values[field]
+                if value != value:
+                    values[field] = None
+                elif field in _NULLABLE_INT_FIELDS:
+                    values[field] = int(value)
+        return values
+
+    def rows_by_id(self, record_ids: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Return the fields of the rows with the given record ids (all rows by default), oldest first."""
+        if record_ids is None:
+            positions = range(len(self))
+        else:
+            positions = sorted(position for position in map(self._positions.get, set(record_ids)) if position is not None)
+        return [self.row(position) for position in positions]
+
+    def records(self, since: Optional[int] = None, until: Optional[int] = None, limit: Optional[int] = None) -> List[MeasurementDetail]:
+        """Return the records between ``since`` and ``until`` (inclusive), newest first."""
+        start, stop = self.span(since, until)
+        if limit is not None:
+            start = max(start, stop - limit)
+        return [MeasurementDetail(**self.row(position)) for position in range(stop - 1, start - 1, -1)]
+
+    def to_dicts(self, since: Optional[int] = None, until: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the rows between ``since`` and ``until`` as plain dicts, newest first."""
+        start, stop = self.span(since, until)
+        return [self.row(position) for position in range(stop - 1, start - 1, -1)]
+
+    def iter_rows(self, *fields: str) -> Iterator[tuple]:
+        """Yield named tuples of the given fields for every row, oldest first, without building records."""
+        row_type = _row_type(fields)
+        return map(row_type._make, zip(*(self._columns[field] for field in fields)))
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def __getitem__(self, index):
+        """Return the ``index``-th newest record, or a list of records for a slice."""
+        size = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("measurement history index out of range")
+        return MeasurementDetail(**self.row(size - 1 - index))
+
+    def __iter__(self) -> Iterator[MeasurementDetail]:
+        for position in range(len(self) - 1, -1, -1):
+            yield MeasurementDetail(**self.row(position))
+
+    # ------------------- Columns -------------------
+
+    def span(self, since: Optional[int] = None, until: Optional[int] = None) -> Tuple[int, int]:
+        """Return the row range ``[start, stop)`` with ``since <= time_stamp <= until``."""
+        time_stamps = self._columns["time_stamp"]
+        start = bisect.bisect_left(time_stamps, since) if since is not None else 0
+        stop = bisect.bisect_right(time_stamps, until) if until is not None else len(time_stamps)
+        return start, max(start, stop)
+
+    def column(self, field: str, since: Optional[int] = None, until: Optional[int] = None):
+        """
+        Return the values of one field between ``since`` and ``until``, oldest first.
+
+        Numeric fields are returned as a numpy array when numpy is installed and as
+        an ``array`` otherwise; missing values are NaN. Text fields are returned as a
+        list. The result is a copy and stays valid when the history changes.
+        """
+        start, stop = self.span(since, until)
+        values = self._columns[field][start:stop]
+        if numpy is not None and isinstance(values, array.array):
+            dtype = numpy.int64 if values.typecode == "q" else numpy.float64
+            # Older numpy releases reject zero-length buffers
+            return numpy.frombuffer(values, dtype=dtype) if values else numpy.empty(0, dtype=dtype)
+        return values
+
+    def aggregate(self, field: str, since: Optional[int] = None, until: Optional[int] = None) -> Dict[str, Optional[float]]:
+        """
+        Return the count, mean, min and max of a numeric field between ``since`` and ``until``.
+
+        Missing and zero values are skipped; Renpho reports metrics a scale did not measure as 0.
+        """
+        values = self.column(field, since, until)
+        if numpy is not None:
+            values = values[(values == values) & (values != 0)]
+            if not len(values):
+                return {"count": 0, "mean": None, "min": None, "max": None}
+            return {"count": int(len(values)), "mean": float(values.mean()), "min": float(values.min()), "max": float(values.max())}
+
+        values = [value for value in values if value == value and value != 0]
+        if not values:
+            return {"count": 0, "mean": None, "min": None, "max": None}
+        return {"count": len(values), "mean": math.fsum(values) / len(values), "min": min(values), "max": max(values)}
+
+    def hourly(self, field: str, since: Optional[int] = None) -> List[Tuple[int, float, float, float]]:
+        """
+        Return ``(hour_start, mean, min, max)`` of a numeric field per hour from ``since``, oldest first.
+
+        Missing and zero values are skipped, as in ``aggregate``.
+        """
+        time_stamps = self.column("time_stamp", since)
+        values = self.column(field, since)
+        if numpy is not None:
+            keep = (values == values) & (values != 0)
+            time_stamps, values = time_stamps[keep], values[keep]
+            if not len(values):
+                return []
+            hours = time_stamps - time_stamps % 3600
+            starts = numpy.flatnonzero(numpy.diff(hours, prepend=hours[0] - 1))
+            counts = numpy.diff(numpy.append(starts, len(values)))
+            means = numpy.add.reduceat(values, starts) / counts
+            minimums = numpy.minimum.reduceat(values, starts)
+            maximums = numpy.maximum.reduceat(values, starts)
+            return list(zip(hours[starts].tolist(), means.tolist(), minimums.tolist(), maximums.tolist()))
+
+        result: List[Tuple[int, float, float, float]] = []
+        hour, bucket = None, []
+        for time_stamp, value in zip(time_stamps, values):
+            if value != value or value == 0:
+                continue
+            if time_stamp - time_stamp % 3600 != hour:
+                if bucket:
+                    result.append((hour, math.fsum(bucket) / len(bucket), min(bucket), max(bucket)))
+                hour, bucket = time_stamp - time_stamp % 3600, []
+            bucket.append(value)
+        if bucket:
+            result.append((hour, math.fsum(bucket) / len(bucket), min(bucket), max(bucket)))
+        return result
+
+    @property
+    def nbytes(self) -> int:
+        """Return the approximate memory held by the columns and interned strings."""
+        size = sys.getsizeof(self._digests) + sys.getsizeof(self._positions)
+        size += sum(sys.getsizeof(column) for column in self._columns.values())
+        return size + sum(sys.getsizeof(value) for value in self._strings)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the size of the history for diagnostics."""
+        return {
+            "rows": len(self),
+            "bytes": self.nbytes,
+            "backend": "numpy" if numpy is not None else "array",
+            "validated": self.validated,
+        }
+
+
+_ROW_TYPES: Dict[Tuple[str, ...], type] = {}
+
+
+def _row_type(fields: Tuple[str, ...]) -> type:
+    row_type = _ROW_TYPES.get(fields)
+    if row_type is None:
+        row_type = _ROW_TYPES[fields] = namedtuple("MeasurementRow", fields)
+    return row_type
@@ -0,0 +1,151 @@
+"""Latest-value indexes over Renpho girth and girth goal records."""
+
+from types import MappingProxyType
+from typing import Dict, Final, Iterable, List, Mapping, NamedTuple, Optional, Set
+
+from .api_object import Girth, GirthGoal
+
+# Girth fields holding a measured value; the sensor id is the field without the suffix
+GIRTH_VALUE_FIELDS: Final = [field for field in Girth.__annotations__ if field.endswith("_value")]
+
+
+class IndexedValue(NamedTuple):
+    """The latest non-zero value of one girth field and the record it came from."""
+
+    value: float
+    time_stamp: int
+    girth_id: int
+
+
+class GirthIndex:
+    """
+    Latest non-zero value and timestamp of every girth field.
+
+    New records are applied incrementally: a record only replaces an entry it is
+    at least as new as. When a record that currently provides an entry is edited
+    or deleted, the index is rebuilt from the full record list, because the
+    replacement may be any older record.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._latest: Dict[str, IndexedValue] = {}
+        self.rebuilds = 0
+
+    def latest(self, metric: str) -> Optional[IndexedValue]:
+        """Return the latest non-zero value of ``metric`` (e.g. ``waist``), or None."""
+        return self._latest.get(metric)
+
+    def rebuild(self, girths: Iterable[Girth]):
+        """Rebuild the index from every known record."""
+        self._latest = {}
+        self._apply(girths)
+        self.rebuilds += 1
+
+    def merge(self, girths: List[Girth], deleted_ids: Iterable[int], all_girths: Iterable[Girth]):
+        """
+        Apply changed and deleted records.
+
+        Parameters:
+            girths (List[Girth]): New or edited records.
+            deleted_ids (Iterable[int]): Ids of deleted records.
+            all_girths (Iterable[Girth]): Every record after the merge, used if a rebuild is needed.
+        """
+        touched: Set[int] = {girth.girth_id for girth in girths}
+        touched.update(deleted_ids)
+        if any(entry.girth_id in touched for entry in self._latest.values()):
+            self.rebuild(all_girths)
+        else:
+            self._apply(girths)
+
+    def _apply(self, girths: Iterable[Girth]):
+        latest = self._latest
+        for girth in girths:
+            for field in GIRTH_VALUE_FIELDS:
+                value = getattr(girth, field)
+                if value in (None, 0.0):
+                    continue
+                metric = field[: -len("_value")]
+                current = latest.get(metric)
+                if current is None or girth.time_stamp >= current.time_stamp:
+                    latest[metric] = IndexedValue(value, girth.time_stamp, girth.girth_id)
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+
+class GoalEntry(NamedTuple):
+    """The active goal of one girth type."""
+
+    goal_value: float
+    setup_goal_at: int
+    initial_value: float
+    finish_goal_at: int
+    finish_value: float
+    girth_goal_id: int
+
+    @property
+    def finished(self) -> bool:
+        """Return True if the goal has been reached."""
+        return bool(self.finish_goal_at)
+
+
+class GirthGoalIndex:
+    """
+    Active goal of every girth type.
+
+    The active goal is the most recently set goal with a non-zero value. Updates
+    follow the same rules as ``GirthIndex``: new goals are applied incrementally and
+    the index is rebuilt when the goal that provides an entry changes.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._goals: Dict[str, GoalEntry] = {}
+        self.rebuilds = 0
+
+    def latest(self, girth_type: str) -> Optional[GoalEntry]:
+        """Return the active goal of ``girth_type`` (e.g. ``waist``), or None."""
+        return self._goals.get(girth_type)
+
+    def goals(self) -> Mapping[str, GoalEntry]:
+        """Return a read-only view of the active goal of every girth type."""
+        return MappingProxyType(self._goals)
+
+    def rebuild(self, goals: Iterable[GirthGoal]):
+        """Rebuild the index from every known goal."""
+        self._goals = {}
+        self._apply(goals)
+        self.rebuilds += 1
+
+    def merge(self, goals: List[GirthGoal], all_goals: Iterable[GirthGoal]):
+        """
+        Apply new or edited goals.
+
+        Parameters:
+            goals (List[GirthGoal]): New or edited goals.
+            all_goals (Iterable[GirthGoal]): Every goal after the merge, used if a rebuild is needed.
+        """
+        touched: Set[int] = {goal.girth_goal_id for goal in goals}
+        if any(entry.girth_goal_id in touched for entry in self._goals.values()):
+            self.rebuild(all_goals)
+        else:
+            self._apply(goals)
+
+    def _apply(self, goals: Iterable[GirthGoal]):
+        for goal in goals:
+            if goal.goal_value in (None, 0.0):
+                continue
+            current = self._goals.get(goal.girth_type)
+            if current is None or goal.setup_goal_at >= current.setup_goal_at:
+                self._goals[goal.girth_type] = GoalEntry(
+                    goal.goal_value,
+                    goal.setup_goal_at,
+                    goal.initial_value,
+                    goal.finish_goal_at,
+                    goal.finish_value,
+                    goal.girth_goal_id,
+                )
+
+    def __len__(self) -> int:
+        return len(self._goals)
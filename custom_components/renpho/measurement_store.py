@@ -0,0 +1,238 @@
+"""Local SQLite store for Renpho measurement, girth and girth goal records."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+from typing import Dict, Final, Iterable, List, NamedTuple, Optional, Type
+
+from pydantic import BaseModel
+
+from .api_object import Girth, GirthGoal, MeasurementDetail
+from .const import METRIC_TYPE_GIRTH, METRIC_TYPE_GIRTH_GOAL, METRIC_TYPE_WEIGHT
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BATCH_DELAY: Final = 5  # Seconds queued writes are batched before a flush
+DEFAULT_BATCH_SIZE: Final = 500  # Queued records that trigger an immediate flush
+
+
+class RecordKind(NamedTuple):
+    """How records of one metric type are stored."""
+
+    table: str
+    model: Type[BaseModel]
+    id_field: str
+    user_field: str
+    time_field: str
+
+
+RECORD_KINDS: Final = {
+    METRIC_TYPE_WEIGHT: RecordKind("measurements", MeasurementDetail, "id", "b_user_id", "time_stamp"),
+    METRIC_TYPE_GIRTH: RecordKind("girths", Girth, "girth_id", "user_id", "time_stamp"),
+    METRIC_TYPE_GIRTH_GOAL: RecordKind("girth_goals", GirthGoal, "girth_goal_id", "user_id", "setup_goal_at"),
+}
+
+
+class MeasurementStore:
+    """
+    Persist raw API records in SQLite so history survives restarts without a re-download.
+
+    Each metric type has its own table keyed by record id and indexed on
+    ``(user_id, time_stamp)``. Records are stored as the raw JSON the API returned
+    and turned back into their pydantic model when read.
+
+    Writes are queued and flushed in one transaction by a background task, either
+    ``batch_delay`` seconds after the first queued write or as soon as
+    ``batch_size`` records are waiting. SQLite calls run in the default executor
+    and are serialized by a lock, so the event loop never blocks on disk I/O.
+    Reads flush pending writes first and therefore always see queued records.
+    """
+
+    def __init__(self, path: str, batch_delay: float = DEFAULT_BATCH_DELAY, batch_size: int = DEFAULT_BATCH_SIZE):
+        """Initialize the store for the database file at ``path``. Call ``async_open`` before use."""
+        self.path = path
+        self.batch_delay = batch_delay
+        self.batch_size = batch_size
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = asyncio.Lock()
+        self._pending: List[tuple] = []
+        self._pending_records = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self.stats = {"flushes": 0, "written": 0, "deleted": 0}
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if the database connection is open."""
+        return self._connection is not None
+
+    async def async_open(self):
+        """Open the database and create the tables and indexes if needed."""
+        async with self._lock:
+            if self._connection is None:
+                self._connection = await self._run(self._open)
+
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            for kind in RECORD_KINDS.values():
+                connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {kind.table} ("
+                    "id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                    "time_stamp INTEGER NOT NULL, payload TEXT NOT NULL)"
+                )
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {kind.table}_user_time "
+                    f"ON {kind.table} (user_id, time_stamp)"
+                )
+        return connection
+
+    # ------------------- Writes -------------------
+
+    def queue_upsert(self, metric_type: str, records: Iterable[Dict]):
+        """Queue raw records to be inserted or replaced by id."""
+        rows = [self._row(RECORD_KINDS[metric_type], record) for record in records]
+        if rows:
+            self._queue(("upsert", metric_type, rows), len(rows))
+
+    def queue_delete(self, metric_type: str, record_ids: Iterable[int]):
+        """Queue records to be deleted by id."""
+        ids = [(int(record_id),) for record_id in record_ids]
+        if ids:
+            self._queue(("delete", metric_type, ids), len(ids))
+
+    def queue_replace(self, metric_type: str, user_id, records: Iterable[Dict]):
+        """Queue replacing every stored record of a user with ``records``."""
+        rows = [self._row(RECORD_KINDS[metric_type], record) for record in records]
+        self._queue(("replace", metric_type, (int(user_id), rows)), len(rows) or 1)
+
+    @staticmethod
+    def _row(kind: RecordKind, record: Dict) -> tuple:
+        return (
+            int(record[kind.id_field]),
+            int(record[kind.user_field]),
+            int(record.get(kind.time_field) or 0),
+            json.dumps(record, separators=(",", ":")),
+        )
+
+    def _queue(self, operation: tuple, size: int):
+        self._pending.append(operation)
+        self._pending_records += size
+        if self._pending_records >= self.batch_size:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_delay, self._start_flush)
+
+    def _start_flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self.async_flush())
+
+    async def async_flush(self):
+        """Write every queued operation in a single transaction."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._lock:
+            if not self._pending or self._connection is None:
+                return
+            pending, self._pending, self._pending_records = self._pending, [], 0
+            try:
+                await self._run(self._write, pending)
+            except Exception as e:
+                _LOGGER.error(f"Failed to write Renpho records to {self.path}: {e}")
+
+    def _write(self, pending: List[tuple]):
+        with self._connection:
+            for action, metric_type, payload in pending:
+                table = RECORD_KINDS[metric_type].table
+                if action == "upsert":
+                    self._connection.executemany(f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?, ?)", payload)
+                    self.stats["written"] += len(payload)
+                elif action == "delete":
+                    self._connection.executemany(f"DELETE FROM {table} WHERE id = ?", payload)
+                    self.stats["deleted"] += len(payload)
+                elif action == "replace":
+                    user_id, rows = payload
+                    self._connection.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+                    self._connection.executemany(f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?, ?)", rows)
+                    self.stats["written"] += len(rows)
+        self.stats["flushes"] += 1
+
+    # ------------------- Reads -------------------
+
+    async def async_latest(self, metric_type: str, user_id) -> Optional[BaseModel]:
+        """Return the newest stored record of a user, or None."""
+        records = await self.async_history(metric_type, user_id, limit=1)
+        return records[0] if records else None
+
+    async def async_history(
+        self,
+        metric_type: str,
+        user_id,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[BaseModel]:
+        """
+        Return stored records of a user, newest first.
+
+        Parameters:
+            metric_type (str): One of ``weight``, ``girth`` or ``girth_goals``.
+            user_id: The user whose records to return.
+            since (Optional[int]): Only records at or after this timestamp.
+            until (Optional[int]): Only records at or before this timestamp.
+            limit (Optional[int]): Return at most this many records.
+        """
+        await self.async_flush()
+        kind = RECORD_KINDS[metric_type]
+        query = f"SELECT payload FROM {kind.table} WHERE user_id = ?"
+        params: list = [int(user_id)]
+        if since is not None:
+            query += " AND time_stamp >= ?"
+            params.append(since)
+        if until is not None:
+            query += " AND time_stamp <= ?"
+            params.append(until)
+        query += " ORDER BY time_stamp DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        async with self._lock:
+            if self._connection is None:
+                return []
+            rows = await self._run(self._select, query, params)
+
+        records = []
+        for (payload,) in rows:
+            try:
+                records.append(kind.model(**json.loads(payload)))
+            except Exception as e:
+                _LOGGER.warning(f"Skipping unreadable stored {metric_type} record: {e}")
+        return records
+
+    def _select(self, query: str, params: list) -> List[tuple]:
+        return self._connection.execute(query, params).fetchall()
+
+    # ------------------- Lifecycle -------------------
+
+    async def async_close(self):
+        """Flush queued writes and close the database."""
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        await self.async_flush()
+        async with self._lock:
+            if self._connection is not None:
+                await self._run(self._connection.close)
+                self._connection = None
+
+    @staticmethod
+    async def _run(func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
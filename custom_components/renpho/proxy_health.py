@@ -0,0 +1,167 @@
+"""Cached proxy health state for the Renpho client."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Final, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+PROXY_STATE_UNKNOWN: Final = "unknown"
+PROXY_STATE_HEALTHY: Final = "healthy"
+PROXY_STATE_UNHEALTHY: Final = "unhealthy"
+
+CIRCUIT_CLOSED: Final = "closed"
+CIRCUIT_OPEN: Final = "open"
+
+DEFAULT_PROXY_HEALTH_TTL: Final = 300  # Seconds a failed probe result is trusted
+DEFAULT_FAILURE_THRESHOLD: Final = 3  # Transport failures before the circuit opens
+DEFAULT_RECOVERY_INTERVAL: Final = 30  # First background re-probe delay in seconds
+DEFAULT_MAX_RECOVERY_INTERVAL: Final = 600  # Upper bound for the re-probe delay
+
+
+class ProxyHealth:
+    """
+    Track whether the configured proxy can reach the Renpho API.
+
+    The probe result is cached: a healthy proxy is not probed again until a
+    request reports a transport failure, and a failed probe is trusted for
+    ``ttl`` seconds before the next attempt. In circuit-breaker mode the request
+    path never probes; repeated failures open the circuit and a background task
+    re-probes with exponential backoff until the proxy recovers.
+
+    Attributes:
+        state (str): One of ``unknown``, ``healthy`` or ``unhealthy``.
+        circuit (str): ``closed`` while requests may flow, ``open`` while they fail fast.
+        checked_at (float, optional): Monotonic time of the last probe.
+        consecutive_failures (int): Transport failures since the last success.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], Awaitable[bool]],
+        ttl: float = DEFAULT_PROXY_HEALTH_TTL,
+        circuit_breaker: bool = False,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_interval: float = DEFAULT_RECOVERY_INTERVAL,
+        max_recovery_interval: float = DEFAULT_MAX_RECOVERY_INTERVAL,
+    ):
+        """Initialize the health tracker with the coroutine used to probe the proxy."""
+        self._probe = probe
+        self.ttl = ttl
+        self.circuit_breaker = circuit_breaker
+        self.failure_threshold = failure_threshold
+        self.recovery_interval = recovery_interval
+        self.max_recovery_interval = max_recovery_interval
+        self.state: str = PROXY_STATE_UNKNOWN
+        self.circuit: str = CIRCUIT_CLOSED
+        self.checked_at: Optional[float] = None
+        self.consecutive_failures: int = 0
+        self.probe_count: int = 0
+        self._lock = asyncio.Lock()
+        self._recovery_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return True if the last probe happened less than ``ttl`` seconds ago."""
+        return self.checked_at is not None and time.monotonic() - self.checked_at < self.ttl
+
+    async def async_check(self) -> bool:
+        """Probe the proxy now, update the cached state and return the result."""
+        async with self._lock:
+            return await self._async_probe()
+
+    async def async_ensure_healthy(self) -> bool:
+        """
+        Return whether requests should be sent through the proxy.
+
+        Only probes when the state is unknown (first use or after a transport
+        failure) or a failed probe has expired. Never probes in circuit-breaker mode.
+        """
+        if self.circuit_breaker:
+            return self.circuit == CIRCUIT_CLOSED
+
+        if self.state == PROXY_STATE_HEALTHY:
+            return True
+        if self.state == PROXY_STATE_UNHEALTHY and self.is_fresh:
+            return False
+
+        async with self._lock:
+            # Another caller may have probed while we were waiting for the lock.
+            if self.state == PROXY_STATE_HEALTHY:
+                return True
+            if self.state == PROXY_STATE_UNHEALTHY and self.is_fresh:
+                return False
+            return await self._async_probe()
+
+    def report_success(self):
+        """Record a request that went through the proxy successfully."""
+        if self.state != PROXY_STATE_HEALTHY:
+            _LOGGER.info("Proxy is healthy again.")
+        self.state = PROXY_STATE_HEALTHY
+        self.consecutive_failures = 0
+        self.circuit = CIRCUIT_CLOSED
+
+    def report_failure(self):
+        """Record a transport failure so the proxy is re-checked."""
+        self.consecutive_failures += 1
+        self.state = PROXY_STATE_UNKNOWN
+
+        if not self.circuit_breaker or self.circuit == CIRCUIT_OPEN:
+            return
+        if self.consecutive_failures >= self.failure_threshold:
+            _LOGGER.warning(
+                f"Proxy failed {self.consecutive_failures} times in a row. Opening circuit."
+            )
+            self.circuit = CIRCUIT_OPEN
+            self.state = PROXY_STATE_UNHEALTHY
+            self._start_recovery()
+
+    def as_dict(self) -> Dict:
+        """Return the health state for logging and diagnostics."""
+        return {
+            "state": self.state,
+            "circuit": self.circuit,
+            "circuit_breaker": self.circuit_breaker,
+            "consecutive_failures": self.consecutive_failures,
+            "probe_count": self.probe_count,
+            "seconds_since_check": (
+                round(time.monotonic() - self.checked_at, 1) if self.checked_at is not None else None
+            ),
+        }
+
+    def stop(self):
+        """Cancel the background recovery task, if any."""
+        if self._recovery_task and not self._recovery_task.done():
+            self._recovery_task.cancel()
+        self._recovery_task = None
+
+    async def _async_probe(self) -> bool:
+        self.probe_count += 1
+        try:
+            healthy = await self._probe()
+        except Exception as e:
+            _LOGGER.error(f"Proxy probe failed: {e}")
+            healthy = False
+
+        self.checked_at = time.monotonic()
+        if healthy:
+            self.report_success()
+        else:
+            self.state = PROXY_STATE_UNHEALTHY
+        return healthy
+
+    def _start_recovery(self):
+        if self._recovery_task and not self._recovery_task.done():
+            return
+        self._recovery_task = asyncio.get_running_loop().create_task(self._async_recover())
+
+    async def _async_recover(self):
+        """Re-probe in the background with exponential backoff until the proxy answers."""
+        delay = self.recovery_interval
+        while self.circuit == CIRCUIT_OPEN:
+            await asyncio.sleep(delay)
+            if await self.async_check():
+                _LOGGER.info("Proxy recovered. Closing circuit.")
+                return
+            delay = min(delay * 2, self.max_recovery_interval)
@@ -0,0 +1,116 @@
+"""Per-endpoint refresh intervals for the Renpho coordinator."""
+
+import time
+from typing import Dict, Final, List, Optional
+
+DEFAULT_STALENESS_FACTOR: Final = 3  # Missed intervals before an endpoint counts as stale
+DUE_SLACK_SHARE: Final = 0.05  # Share of an interval a refresh may arrive early and still fetch
+MIN_DUE_SLACK: Final = 1.0  # Seconds a refresh may always arrive early
+
+
+def _slack(interval: float) -> float:
+    return max(MIN_DUE_SLACK, DUE_SLACK_SHARE * interval)
+
+
+class RefreshScheduler:
+    """
+    Decide which endpoints a coordinator refresh has to fetch.
+
+    Every endpoint has its own interval: it is due when it has never been fetched
+    successfully or when its last success is about one interval old. Refreshes
+    are scheduled at the same interval and may run slightly early, so an endpoint
+    is already due ``max(MIN_DUE_SLACK, DUE_SLACK_SHARE * interval)`` seconds
+    before its interval has fully passed.
+
+    A failed fetch is retried with exponential backoff: after ``failure_backoff``
+    seconds (the shortest interval unless given), doubling with every further
+    failure up to the endpoint's own interval. A failing slow endpoint therefore
+    does not spend every refresh, and its retries, on a request that keeps
+    failing. An endpoint whose last success is older than its staleness budget
+    (``DEFAULT_STALENESS_FACTOR`` intervals unless given) is reported as stale.
+
+    Attributes:
+        intervals (Dict[str, float]): Seconds between fetches, by endpoint.
+        max_staleness (Dict[str, float]): Seconds after which data counts as stale, by endpoint.
+        failure_backoff (float): Seconds before the first retry of a failed fetch.
+    """
+
+    def __init__(
+        self,
+        intervals: Dict[str, float],
+        max_staleness: Optional[Dict[str, float]] = None,
+        failure_backoff: Optional[float] = None,
+    ):
+        """Initialize the scheduler. Every endpoint is due on the first refresh."""
+        self.intervals = dict(intervals)
+        self.max_staleness = {
+            name: (max_staleness or {}).get(name, interval * DEFAULT_STALENESS_FACTOR)
+            for name, interval in self.intervals.items()
+        }
+        self.failure_backoff = failure_backoff if failure_backoff is not None else min(self.intervals.values(), default=0)
+        self._last_success: Dict[str, float] = {}
+        self._last_attempt: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+        self.fetch_counts: Dict[str, int] = {name: 0 for name in self.intervals}
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """Return the endpoints that have to be fetched now."""
+        now = now if now is not None else time.monotonic()
+        due = []
+        for name, interval in self.intervals.items():
+            if name in self._failures:
+                delay = self.retry_delay(name)
+                if now - self._last_attempt[name] < delay - _slack(delay):
+                    continue
+            elif name in self._last_success and now - self._last_success[name] < interval - _slack(interval):
+                continue
+            due.append(name)
+        return due
+
+    def retry_delay(self, name: str) -> Optional[float]:
+        """Return the seconds between the last failed fetch of an endpoint and its retry, or None."""
+        failures = self._failures.get(name)
+        if not failures:
+            return None
+        return min(self.intervals[name], self.failure_backoff * 2 ** (failures - 1))
+
+    def record(self, name: str, success: bool, now: Optional[float] = None):
+        """Record the outcome of fetching an endpoint."""
+        now = now if now is not None else time.monotonic()
+        self._last_attempt[name] = now
+        self.fetch_counts[name] = self.fetch_counts.get(name, 0) + 1
+        if success:
+            self._last_success[name] = now
+            self._failures.pop(name, None)
+        else:
+            self._failures[name] = self._failures.get(name, 0) + 1
+
+    def age(self, name: str, now: Optional[float] = None) -> Optional[float]:
+        """Return the seconds since the last successful fetch of an endpoint."""
+        if name not in self._last_success:
+            return None
+        return (now if now is not None else time.monotonic()) - self._last_success[name]
+
+    def stale(self, now: Optional[float] = None) -> List[str]:
+        """Return the endpoints that have exceeded their staleness budget."""
+        now = now if now is not None else time.monotonic()
+        return [
+            name for name in self.intervals
+            if name in self._last_attempt
+            and (self.age(name, now) is None or self.age(name, now) > self.max_staleness[name])
+        ]
+
+    def as_dict(self) -> Dict:
+        """Return the schedule state for logging and diagnostics."""
+        now = time.monotonic()
+        return {
+            name: {
+                "interval": interval,
+                "max_staleness": self.max_staleness[name],
+                "age": round(self.age(name, now), 1) if self.age(name, now) is not None else None,
+                "fetch_count": self.fetch_counts.get(name, 0),
+                "failures": self._failures.get(name, 0),
+                "retry_delay": self.retry_delay(name),
+            }
+            for name, interval in self.intervals.items()
+        }
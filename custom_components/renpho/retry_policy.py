@@ -0,0 +1,138 @@
+"""Retry policy with exponential backoff, deadlines and a retry budget."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Final, Optional
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RETRY_ATTEMPTS: Final = 3  # Total attempts per request, including the first one
+DEFAULT_RETRY_BASE_DELAY: Final = 1.0  # Seconds; the backoff cap doubles per attempt from here
+DEFAULT_RETRY_MAX_DELAY: Final = 30.0  # Upper bound of a single backoff in seconds
+DEFAULT_RETRY_BUDGET: Final = 10  # Retries allowed per budget window across all requests
+DEFAULT_RETRY_BUDGET_WINDOW: Final = 600  # Seconds in which the budget fully refills
+
+RETRYABLE_STATUS_CODES: Final = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Classify an error raised while talking to the Renpho API.
+
+    Connection problems, timeouts and overload/gateway HTTP statuses are transient
+    and worth retrying. Any other HTTP error or API-level failure is fatal.
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRYABLE_STATUS_CODES
+    return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError))
+
+
+def describe_error(error: BaseException) -> str:
+    """Describe an error for logging without the request URL, which carries the session key."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return f"HTTP {error.status} {error.message}"
+    return f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+
+
+class RetryBudget:
+    """
+    Token bucket limiting the number of retries across all requests.
+
+    During an outage every request fails, so per-request retries alone would
+    multiply the load on the API. The bucket holds ``capacity`` retries and
+    refills at ``capacity / window`` retries per second.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_RETRY_BUDGET, window: float = DEFAULT_RETRY_BUDGET_WINDOW):
+        """Initialize a full bucket."""
+        self.capacity = capacity
+        self.window = window
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    @property
+    def available(self) -> float:
+        """Return the number of retries currently available."""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self) -> bool:
+        """Take one retry from the bucket. Returns False if the budget is spent."""
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.window > 0:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.capacity / self.window)
+        self._updated = now
+
+
+class RetryPolicy:
+    """
+    Decide whether and when a failed request is retried.
+
+    Delays use exponential backoff with full jitter: attempt ``n`` sleeps a random
+    time between 0 and ``min(max_delay, base_delay * 2 ** n)``. A retry is skipped
+    when the attempts are used up, when the sleep would overrun the current refresh
+    deadline, or when the shared retry budget is spent.
+    """
+
+    def __init__(
+        self,
+        attempts: int = DEFAULT_RETRY_ATTEMPTS,
+        base_delay: float = DEFAULT_RETRY_BASE_DELAY,
+        max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """Initialize the policy."""
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget()
+        self.deadline: Optional[float] = None
+        self.stats = {"retries": 0, "exhausted": 0, "deadline_exceeded": 0, "budget_exhausted": 0}
+
+    def set_deadline(self, seconds: Optional[float]):
+        """Set the time left for the current refresh, or clear it with None."""
+        self.deadline = time.monotonic() + seconds if seconds is not None else None
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay before retry number ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def async_wait(self, attempt: int) -> bool:
+        """
+        Sleep before retry number ``attempt`` (0-based) if a retry is allowed.
+
+        Returns True if the caller should retry and False if it should give up.
+        """
+        if attempt + 1 >= self.attempts:
+            self.stats["exhausted"] += 1
+            return False
+
+        delay = self.backoff(attempt)
+        if self.deadline is not None and time.monotonic() + delay >= self.deadline:
+            self.stats["deadline_exceeded"] += 1
+            _LOGGER.debug("Not retrying: the refresh deadline would be exceeded.")
+            return False
+
+        if not self.budget.try_acquire():
+            self.stats["budget_exhausted"] += 1
+            _LOGGER.warning("Retry budget exhausted. Not retrying until it refills.")
+            return False
+
+        self.stats["retries"] += 1
+        await asyncio.sleep(delay)
+        return True
+
+    def as_dict(self) -> Dict:
+        """Return the retry counters and remaining budget."""
+        return {**self.stats, "budget_available": round(self.budget.available, 2)}
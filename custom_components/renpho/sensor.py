@@ -11,7 +11,8 @@ import warnings
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util import slugify
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
@@ -21,12 +22,12 @@ from .const import (
     CONF_REFRESH,
     CONF_UNIT_OF_MEASUREMENT,
     DOMAIN,
-    KG_TO_LBS,
     MASS_KILOGRAMS,
     MASS_POUNDS,
 )
 from .api_renpho import _LOGGER, RenphoWeight
 from .sensor_configs import sensor_configurations
+from .snapshot import is_sparse
 
 
 async def sensors_list(
@@ -38,6 +39,75 @@ async def sensors_list(
         for sensor in sensor_configurations
     ]
 
+
+class RenphoSensorManager:
+    """
+    Add the sensors an account has data for and keep them updated.
+
+    Sensors are created from the first snapshot:
+
+    - metrics with a value are added enabled;
+    - weight metrics the scale reports without a value are added disabled by default;
+    - metrics missing from the snapshot (girths and goals never recorded) are held
+      back and added once they first appear.
+
+    Sensors that are already in the entity registry are always added. A single
+    coordinator listener fans every update out to the added sensors in one pass
+    instead of each sensor scheduling its own job.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, sensors: list[RenphoSensor], async_add_entities: AddEntitiesCallback):
+        """Initialize the manager with every configured sensor."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.async_add_entities = async_add_entities
+        self.active: list[RenphoSensor] = []
+        self.pending: list[RenphoSensor] = []
+        self._sensors = sensors
+
+    def async_setup(self):
+        """Add the initial sensors and subscribe to coordinator updates. Returns the unsubscribe function."""
+        snapshot = self.coordinator.data
+        registry = er.async_get(self.hass)
+        for sensor in self._sensors:
+            if snapshot is None or registry.async_get_entity_id("sensor", DOMAIN, sensor.unique_id):
+                self.active.append(sensor)
+                continue
+            metric_value = snapshot.get(sensor.metric_type, sensor.metric_id)
+            if metric_value is None:
+                self.pending.append(sensor)
+                continue
+            if is_sparse(metric_value.value):
+                sensor._attr_entity_registry_enabled_default = False
+            self.active.append(sensor)
+
+        _LOGGER.info(f"Adding {len(self.active)} Renpho sensors; {len(self.pending)} wait for their first value.")
+        self.async_add_entities(self.active, update_before_add=True)
+        return self.coordinator.async_add_listener(self.dispatch)
+
+    @callback
+    def dispatch(self):
+        """Update every added sensor and add the held back sensors whose metric appeared."""
+        for sensor in self.active:
+            if sensor.hass is not None:
+                sensor.handle_coordinator_update()
+
+        snapshot = self.coordinator.data
+        if not self.pending or snapshot is None:
+            return
+        appeared = [sensor for sensor in self.pending if snapshot.get(sensor.metric_type, sensor.metric_id) is not None]
+        if appeared:
+            self.pending = [sensor for sensor in self.pending if sensor not in appeared]
+            self.active.extend(appeared)
+            self.async_add_entities(appeared, update_before_add=True)
+
+
+async def async_setup_sensors(hass: HomeAssistant, coordinator, async_add_entities: AddEntitiesCallback):
+    """Add the Renpho sensors for ``coordinator``. Returns the function that unsubscribes them."""
+    sensor_entities = await sensors_list(hass, None, coordinator)
+    return RenphoSensorManager(hass, coordinator, sensor_entities, async_add_entities).async_setup()
+
+
 async def async_setup(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -49,9 +119,8 @@ async def async_setup(
     # Fetch initial data so we have data when entities subscribe
     await coordinator.async_config_entry_first_refresh()
 
-    # Create sensor entities and pass them the coordinator
-    sensor_entities = await sensors_list(hass, config_entry, coordinator)
-    async_add_entities(sensor_entities, update_before_add=True)
+    # Create sensor entities for the metrics the account has
+    await async_setup_sensors(hass, coordinator, async_add_entities)
 
 
 async def async_setup_entry(
@@ -65,9 +134,8 @@ async def async_setup_entry(
     # Fetch initial data so we have data when entities subscribe
     await coordinator.async_config_entry_first_refresh()
 
-    # Create sensor entities and pass them the coordinator
-    sensor_entities = await sensors_list(hass, config_entry, coordinator)
-    async_add_entities(sensor_entities, update_before_add=True)
+    # Create sensor entities for the metrics the account has
+    config_entry.async_on_unload(await async_setup_sensors(hass, coordinator, async_add_entities))
 
 
 async def async_setup_platform(
@@ -84,9 +152,8 @@ async def async_setup_platform(
         # Fetch initial data so we have data when entities subscribe
         await coordinator.async_config_entry_first_refresh()
 
-        # Create sensor entities and pass them the coordinator
-        sensor_entities = await sensors_list(hass, config, coordinator)
-        async_add_entities(sensor_entities, update_before_add=True)
+        # Create sensor entities for the metrics the account has
+        await async_setup_sensors(hass, coordinator, async_add_entities)
     except ConnectionError as ex:
         _LOGGER.error(f"Error: {ex}")
         return False
@@ -96,6 +163,11 @@ async def async_setup_platform(
 class RenphoSensor(SensorEntity):
     """Representation of a Renpho sensor."""
 
+    # Constant per sensor, so not worth a recorder row
+    _unrecorded_attributes = frozenset({"category", "label"})
+    # The coordinator listener pushes every update; HA must not poll the sensors as well
+    _attr_should_poll = False
+
     def __init__(
         self,
         coordinator,
@@ -118,18 +190,14 @@ class RenphoSensor(SensorEntity):
         self._unit_of_measurement = unit_of_measurement
         self._state = None
         self._timestamp = None
-
-        self.async_on_remove(
-            coordinator.async_add_listener(self._schedule_update)
-        )
-
-    def _schedule_update(self):
-        """Schedule an update of the coordinator."""
-        self.hass.async_add_job(self._handle_coordinator_update)
-
-    async def _handle_coordinator_update(self):
-        """Handle updated data from the coordinator."""
-        await self.async_update()
+        self._written = None
+
+    def handle_coordinator_update(self):
+        """Handle updated data from the coordinator, writing the state only when it changed."""
+        if not self._update_from_snapshot():
+            self.coordinator.state_writes["suppressed"] += 1
+            return
+        self.coordinator.state_writes["written"] += 1
         self.async_write_ha_state()
 
     @property
@@ -159,6 +227,16 @@ class RenphoSensor(SensorEntity):
     def name(self) -> str:
         return self._name
 
+    @property
+    def metric_type(self) -> str:
+        """Return the metric type the sensor reads, e.g. ``weight`` or ``girth``."""
+        return self._metric
+
+    @property
+    def metric_id(self) -> str:
+        """Return the id of the metric within its type."""
+        return self._id
+
     @property
     def category(self) -> str:
         """Return the category of the sensor."""
@@ -199,32 +277,31 @@ class RenphoSensor(SensorEntity):
         return self._state 
 
     async def async_update(self):
-        """Request an immediate update of the coordinator data."""
-        try:
-            metric_value = await self.coordinator.api.get_specific_metric(
-                metric_type=self._metric,
-                metric=self._id,
-                user_id=None
-            )
-
-            if metric_value is not None:
-                if self._unit_of_measurement == MASS_POUNDS and self._unit == MASS_KILOGRAMS:
-                    self._state = round(metric_value * KG_TO_LBS, 2)
-                elif self._unit_of_measurement == MASS_KILOGRAMS and self._unit == MASS_KILOGRAMS:
-                    self._state = round(metric_value, 2)
-                else:
-                    self._state = metric_value
-                self._timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                _LOGGER.info(f"Successfully updated {self._name} for metric type {self._metric} with value {self._state} with unit {self._unit}")
-            else:
-                self._state = None  # You might choose to clear the state or leave it unchanged
-
-        except (ConnectionError, TimeoutError) as e:
-            _LOGGER.error(
-                f"{type(e).__name__} occurred while updating {self._name} for metric type {self._metric}: {e}"
-            )
-
-        except Exception as e:
-            _LOGGER.critical(
-                f"An unexpected error occurred while updating {self._name} for metric type {self._metric}: {e}"
-            )
+        """Update the state from the latest coordinator snapshot."""
+        self._update_from_snapshot()
+
+    def _update_from_snapshot(self) -> bool:
+        """
+        Read the sensor value from the snapshot published by the coordinator.
+
+        Returns True if the value or its measurement timestamp changed since the last update.
+        """
+        snapshot = self.coordinator.data
+        metric_value = snapshot.get(self._metric, self._id) if snapshot is not None else None
+        current = (metric_value.value, metric_value.time_stamp) if metric_value is not None else None
+        if current == self._written:
+            return False
+        self._written = current
+
+        if metric_value is None:
+            self._state = None
+            return True
+
+        self._state = metric_value.value
+        # Time of the source measurement, so the attribute only changes with new data
+        self._timestamp = (
+            datetime.fromtimestamp(metric_value.time_stamp).strftime("%Y-%m-%d %H:%M:%S")
+            if metric_value.time_stamp else None
+        )
+        _LOGGER.debug(f"Updated {self._name} for metric type {self._metric} with value {self._state} with unit {metric_value.unit}")
+        return True
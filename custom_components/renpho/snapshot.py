@@ -0,0 +1,108 @@
+"""Immutable per-refresh snapshot of every Renpho sensor value."""
+
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
+
+from .const import (
+    KG_TO_LBS,
+    MASS_KILOGRAMS,
+    MASS_POUNDS,
+    METRIC_TYPE_GIRTH,
+    METRIC_TYPE_GIRTH_GOAL,
+    METRIC_TYPE_WEIGHT,
+)
+
+
+class MetricValue(NamedTuple):
+    """The value of one sensor, in the unit it is displayed in."""
+
+    value: Any
+    unit: Optional[str]
+    time_stamp: Optional[int]
+
+
+class MetricSnapshot:
+    """
+    Read-only view of every sensor value at the end of one coordinator refresh.
+
+    Values are keyed by ``(metric_type, metric_id)`` as used in ``sensor_configurations``.
+    A snapshot is never modified after it is built; the next refresh publishes a new one.
+    """
+
+    __slots__ = ("_values", "created_at")
+
+    def __init__(self, values: Mapping[Tuple[str, str], MetricValue], created_at: Optional[float] = None):
+        """Wrap ``values`` without copying them. The caller must not keep a reference."""
+        self._values = MappingProxyType(values)
+        self.created_at = created_at if created_at is not None else time.time()
+
+    def get(self, metric_type: str, metric_id: str) -> Optional[MetricValue]:
+        """Return the value of a sensor, or None if the account has no data for it."""
+        return self._values.get((metric_type, metric_id))
+
+    @property
+    def values(self) -> Mapping[Tuple[str, str], MetricValue]:
+        """Return the read-only mapping of all values."""
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+def is_sparse(value) -> bool:
+    """
+    Return True for the values the API reports for metrics the scale does not measure.
+
+    Missing sensors come back as None, an empty string or zero; zero may be an int,
+    as nullable integer fields are, but a boolean False is a real value.
+    """
+    if value is None or value == "":
+        return True
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value == 0
+
+
+def display_value(value, unit: str, unit_of_measurement: str):
+    """Convert a kilogram value to the configured mass unit and round it like the sensors do."""
+    if unit == MASS_KILOGRAMS and isinstance(value, (int, float)):
+        if unit_of_measurement == MASS_POUNDS:
+            return round(value * KG_TO_LBS, 2), MASS_POUNDS
+        return round(value, 2), MASS_KILOGRAMS
+    return value, unit
+
+
+def build_snapshot(api, sensor_configs: Iterable[Dict], unit_of_measurement: str) -> MetricSnapshot:
+    """
+    Build the snapshot of every configured sensor from the data held by ``api``.
+
+    Weight metrics come from the newest measurement and girth and goal metrics
+    from the girth indexes, matching ``RenphoWeight.get_specific_metric``.
+    """
+    configs = list(sensor_configs)
+    raw: Dict[Tuple[str, str], Tuple[Any, Optional[int]]] = {}
+
+    weight_info = api.weight_info
+    if weight_info is not None:
+        for config in configs:
+            if config["metric"] == METRIC_TYPE_WEIGHT:
+                raw[(METRIC_TYPE_WEIGHT, config["id"])] = (weight_info.get(config["id"], None), weight_info.time_stamp)
+
+    for config in configs:
+        if config["metric"] == METRIC_TYPE_GIRTH:
+            latest = api.girth_index.latest(config["id"])
+            if latest is not None:
+                raw[(METRIC_TYPE_GIRTH, config["id"])] = (latest.value, latest.time_stamp)
+
+    goals = api.girth_goal_index.goals()
+    for config in configs:
+        if config["metric"] == METRIC_TYPE_GIRTH_GOAL and (goal := goals.get(config["id"])) is not None:
+            raw[(METRIC_TYPE_GIRTH_GOAL, config["id"])] = (goal.goal_value, goal.setup_goal_at)
+
+    values: Dict[Tuple[str, str], MetricValue] = {}
+    for config in configs:
+        key = (config["metric"], config["id"])
+        if key in raw:
+            value, time_stamp = raw[key]
+            value, unit = display_value(value, config["unit"], unit_of_measurement)
+            values[key] = MetricValue(value, unit, time_stamp)
+    return MetricSnapshot(values)
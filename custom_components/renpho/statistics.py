@@ -0,0 +1,183 @@
+"""Import Renpho measurement history into Home Assistant long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from datetime import datetime, timezone
+import logging
+from typing import Any, Callable, Final, Iterable
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.4 only knows has_mean
+    StatisticMeanType = None
+
+from .const import DOMAIN, METRIC_TYPE_GIRTH, METRIC_TYPE_WEIGHT
+from .sensor_configs import sensor_configurations
+from .snapshot import display_value
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTICS_CHUNK_SIZE: Final = 1000  # Hourly rows per async_add_external_statistics call
+
+# Numeric body composition metrics worth a long-term trend
+WEIGHT_STATISTICS: Final = [
+    "weight", "bmi", "muscle", "bone", "bodyfat", "water", "subfat", "visfat", "bmr", "protein", "bodyage",
+]
+
+
+def statistic_id(metric_type: str, metric_id: str) -> str:
+    """Return the external statistic id of a metric, e.g. ``renpho:weight`` or ``renpho:girth_waist``."""
+    if metric_type == METRIC_TYPE_WEIGHT:
+        return f"{DOMAIN}:{metric_id}"
+    return f"{DOMAIN}:{metric_type}_{metric_id}"
+
+
+class StatisticsImporter:
+    """
+    Import measurement and girth history as external statistics.
+
+    Records are grouped into the hour they were taken in, using their original
+    ``time_stamp``, and written with the hourly mean, min and max. The first run
+    imports the whole history known to the API client, from the last hour already
+    in the recorder if there is one. Later runs only import a metric when it gained
+    records newer than the newest one imported, starting from the hour of the first
+    new record, so an hour is only re-written when it gained a measurement. Rows
+    are written in chunks of ``chunk_size`` so a multi-year backfill does not hold
+    up the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant, api, unit_of_measurement: str, chunk_size: int = STATISTICS_CHUNK_SIZE):
+        """Initialize the importer for the data held by ``api``."""
+        self.hass = hass
+        self.api = api
+        self.unit_of_measurement = unit_of_measurement
+        self.chunk_size = chunk_size
+        self._configs = {(config["metric"], config["id"]): config for config in sensor_configurations}
+        self._last_start: dict[str, float | None] = {}
+        # Newest record time_stamp already imported, by statistic id
+        self._last_time_stamp: dict[str, int] = {}
+        self._lock = asyncio.Lock()
+        self.imported_rows = 0
+
+    def _series(self) -> Iterable[tuple[str, str, Callable, Callable]]:
+        """
+        Yield every metric with two functions of a start time: one returning its hourly
+        ``(start, mean, min, max)`` and one returning the record time stamps, both oldest first.
+        """
+        weight_history = self.api.weight_history
+        if weight_history:
+            # The columnar history aggregates whole columns without rebuilding records
+            time_stamps = functools.partial(weight_history.column, "time_stamp")
+            for metric_id in WEIGHT_STATISTICS:
+                yield METRIC_TYPE_WEIGHT, metric_id, functools.partial(weight_history.hourly, metric_id), time_stamps
+
+        girth_info = self.api.girth_info or []
+        if girth_info:
+            time_stamps = functools.partial(self._girth_time_stamps, girth_info)
+            for (metric_type, metric_id) in self._configs:
+                if metric_type == METRIC_TYPE_GIRTH:
+                    hourly = functools.partial(self._girth_hourly, girth_info, f"{metric_id}_value")
+                    yield metric_type, metric_id, hourly, time_stamps
+
+    @staticmethod
+    def _girth_time_stamps(girths: list, since: float | None) -> list[int]:
+        return sorted(girth.time_stamp for girth in girths if since is None or girth.time_stamp >= since)
+
+    @staticmethod
+    def _girth_hourly(girths: list, field: str, since: float | None) -> list[tuple]:
+        hours: dict[float, list[float]] = {}
+        for girth in girths:
+            hour = girth.time_stamp - girth.time_stamp % 3600
+            value = getattr(girth, field, None)
+            if (since is not None and hour < since) or value is None or value == 0.0:
+                continue
+            hours.setdefault(hour, []).append(value)
+        return [(hour, sum(values) / len(values), min(values), max(values)) for hour, values in sorted(hours.items())]
+
+    async def async_import(self):
+        """Import every hour not yet in the statistics tables. Skipped while an import is running."""
+        if "recorder" not in self.hass.config.components or self._lock.locked():
+            return
+
+        async with self._lock:
+            for metric_type, metric_id, hourly, time_stamps in self._series():
+                try:
+                    await self._async_import_series(metric_type, metric_id, hourly, time_stamps)
+                except Exception as e:
+                    _LOGGER.error(f"Failed to import {metric_type} {metric_id} statistics: {e}")
+
+    async def _async_import_series(self, metric_type: str, metric_id: str, hourly: Callable, time_stamps: Callable):
+        config = self._configs[(metric_type, metric_id)]
+        stat_id = statistic_id(metric_type, metric_id)
+        if stat_id not in self._last_start:
+            self._last_start[stat_id] = await self._async_last_start(stat_id)
+
+        last_time_stamp = self._last_time_stamp.get(stat_id)
+        start = self._last_start[stat_id] if last_time_stamp is None else last_time_stamp + 1
+        new_time_stamps = time_stamps(start)
+        if not len(new_time_stamps):
+            # Nothing newer than what was imported, so every hour is already up to date
+            return
+        newest = int(new_time_stamps[-1])
+        since = start if last_time_stamp is None else new_time_stamps[0] - new_time_stamps[0] % 3600
+
+        hours = hourly(since)
+        if not hours:
+            self._last_time_stamp[stat_id] = newest
+            return
+        _, unit = display_value(hours[0][1], config["unit"], self.unit_of_measurement)
+
+        mean = {"mean_type": StatisticMeanType.ARITHMETIC} if StatisticMeanType is not None else {"has_mean": True}
+        metadata = StatisticMetaData(
+            **mean,
+            has_sum=False,
+            name=f"Renpho {config['name']}",
+            source=DOMAIN,
+            statistic_id=stat_id,
+            unit_of_measurement=unit or None,
+        )
+        rows = [
+            StatisticData(
+                start=datetime.fromtimestamp(hour, timezone.utc),
+                mean=display_value(mean, config["unit"], self.unit_of_measurement)[0],
+                min=display_value(minimum, config["unit"], self.unit_of_measurement)[0],
+                max=display_value(maximum, config["unit"], self.unit_of_measurement)[0],
+            )
+            for hour, mean, minimum, maximum in hours
+        ]
+        for offset in range(0, len(rows), self.chunk_size):
+            async_add_external_statistics(self.hass, metadata, rows[offset:offset + self.chunk_size])
+            await asyncio.sleep(0)
+
+        self.imported_rows += len(rows)
+        self._last_start[stat_id] = hours[-1][0]
+        self._last_time_stamp[stat_id] = newest
+        _LOGGER.debug(f"Imported {len(rows)} hourly {stat_id} statistics.")
+
+    async def _async_last_start(self, stat_id: str) -> float | None:
+        """Return the start of the newest imported hour of a statistic, or None if there is none."""
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, stat_id, True, {"mean"}
+        )
+        if not last.get(stat_id):
+            return None
+        start = last[stat_id][0]["start"]
+        return start.timestamp() if isinstance(start, datetime) else float(start)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the import progress for diagnostics."""
+        return {
+            "imported_rows": self.imported_rows,
+            "last_start": dict(self._last_start),
+            "last_time_stamp": dict(self._last_time_stamp),
+        }
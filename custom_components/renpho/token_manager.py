@@ -0,0 +1,135 @@
+"""Session token lifecycle for the Renpho client."""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Final, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+TOKEN_STATUS_MISSING: Final = "missing"
+TOKEN_STATUS_VALID: Final = "valid"
+TOKEN_STATUS_EXPIRED: Final = "expired"
+TOKEN_STATUS_REJECTED: Final = "rejected"
+
+DEFAULT_TOKEN_MAX_AGE: Final = 24 * 60 * 60  # Seconds before a session key is refreshed proactively
+
+
+class TokenManager:
+    """
+    Own the ``terminal_user_session_key`` of one Renpho account.
+
+    Sign-ins are single-flight: concurrent callers that need a token wait on the
+    same ``asyncio.Lock`` and share the result (token or exception) of the one
+    sign-in that ran while they were waiting. A token is only replaced once it
+    has been rejected by the API (status code 40302) or is older than ``max_age``.
+
+    Attributes:
+        token (str, optional): The current session key.
+        issued_at (float, optional): Wall-clock time at which the token was obtained.
+        sign_in_count (int): Number of sign-ins performed.
+    """
+
+    def __init__(
+        self,
+        sign_in: Callable[[], Awaitable[str]],
+        max_age: float = DEFAULT_TOKEN_MAX_AGE,
+        on_token_update: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize the manager with the coroutine that performs a sign-in and returns the token."""
+        self._sign_in = sign_in
+        self.max_age = max_age
+        self.on_token_update = on_token_update
+        self.token: Optional[str] = None
+        self.issued_at: Optional[float] = None
+        self.sign_in_count: int = 0
+        self._rejected = False
+        self._lock = asyncio.Lock()
+        self._generation = 0
+        self._last_error: Optional[Exception] = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Return the age of the token in seconds."""
+        if self.issued_at is None:
+            return None
+        return max(0.0, time.time() - self.issued_at)
+
+    @property
+    def status(self) -> str:
+        """Return one of ``missing``, ``valid``, ``expired`` or ``rejected``."""
+        if self.token is None:
+            return TOKEN_STATUS_MISSING
+        if self._rejected:
+            return TOKEN_STATUS_REJECTED
+        if self.age is not None and self.age >= self.max_age:
+            return TOKEN_STATUS_EXPIRED
+        return TOKEN_STATUS_VALID
+
+    @property
+    def is_valid(self) -> bool:
+        """Return True if the token can be used without signing in."""
+        return self.status == TOKEN_STATUS_VALID
+
+    def set_token(self, token: Optional[str], issued_at: Optional[float] = None):
+        """Store a token obtained by a sign-in or restored from storage."""
+        self.token = token
+        self.issued_at = (issued_at if issued_at is not None else time.time()) if token else None
+        self._rejected = False
+
+    def invalidate(self, token: Optional[str] = None):
+        """
+        Mark the token as rejected by the API.
+
+        If ``token`` is given, only invalidate when it is still the current token, so a
+        late 40302 for an old key does not discard a freshly issued one.
+        """
+        if token is not None and token != self.token:
+            return
+        if self.token is not None:
+            _LOGGER.debug("Session key rejected. A new sign-in will be performed.")
+        self._rejected = True
+
+    async def async_get_token(self) -> str:
+        """Return a usable token, signing in first if the current one is not valid."""
+        if self.is_valid:
+            return self.token
+        return await self.async_refresh()
+
+    async def async_refresh(self) -> str:
+        """
+        Sign in and return the new token.
+
+        Callers that arrive while a sign-in is running wait for it and reuse its
+        outcome instead of signing in again.
+        """
+        generation = self._generation
+        async with self._lock:
+            if self._generation != generation:
+                if self._last_error is not None:
+                    raise self._last_error
+                if self.is_valid:
+                    return self.token
+
+            self._last_error = None
+            try:
+                self.sign_in_count += 1
+                token = await self._sign_in()
+                self.set_token(token)
+                if self.on_token_update is not None:
+                    self.on_token_update()
+                return token
+            except Exception as e:
+                self._last_error = e
+                raise
+            finally:
+                self._generation += 1
+
+    def as_dict(self) -> Dict:
+        """Return the token lifecycle state without exposing the token itself."""
+        return {
+            "status": self.status,
+            "age": round(self.age, 1) if self.age is not None else None,
+            "max_age": self.max_age,
+            "sign_in_count": self.sign_in_count,
+        }
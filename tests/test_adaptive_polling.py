@@ -0,0 +1,101 @@
+"""Tests for adaptive polling around learned weigh-in windows."""
+
+import json
+from collections import namedtuple
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.renpho.adaptive_polling import AdaptivePolling
+
+Measurement = namedtuple("Measurement", ["time_stamp", "time_zone"])
+
+# A fixed three-month weigh-in log, newest first, as the measurements API returns it but
+# anonymised to time_stamp and time_zone. Weekday mornings around 07:00, weekend mornings
+# later, some evenings, skipped days and the switch to summer time on 2024-03-31.
+FIXTURE = Path(__file__).parent / "fixtures" / "weigh_ins.json"
+LOCAL = ZoneInfo("Europe/Berlin")
+TODAY = datetime(2024, 5, 1, tzinfo=LOCAL)  # The day after the last recorded weigh-in, a Wednesday
+
+
+def local_time(hour: int, minute: int) -> float:
+    """Return the epoch seconds of a local time on ``TODAY``."""
+    return TODAY.replace(hour=hour, minute=minute).timestamp()
+
+
+@pytest.fixture
+def weigh_ins():
+    with open(FIXTURE) as fixture:
+        return [Measurement(**record) for record in json.load(fixture)]
+
+
+@pytest.fixture
+def polling(weigh_ins):
+    adaptive = AdaptivePolling(min_interval=60, max_interval=3600)
+    adaptive.learn(weigh_ins, now=TODAY.timestamp())
+    return adaptive
+
+
+def test_detects_weigh_in_windows(polling):
+    assert polling.samples == 106
+    assert polling.time_zone == LOCAL
+    assert polling.as_dict()["active_windows"] == [
+        "06:00", "06:30", "07:00", "07:30", "08:00", "08:30", "09:00", "09:30",
+        "20:30", "21:00", "21:30", "22:00", "22:30",
+    ]
+
+
+def test_polls_at_min_interval_inside_windows(polling):
+    assert polling.next_interval(local_time(7, 5), new_data=False) == 60
+    assert polling.next_interval(local_time(21, 40), new_data=False) == 60
+
+
+def test_polls_at_min_interval_until_enough_samples(weigh_ins):
+    polling = AdaptivePolling(min_interval=60, max_interval=3600)
+    polling.learn(weigh_ins[:3], now=TODAY.timestamp())
+
+    assert polling.is_active(local_time(13, 0))
+    assert polling.next_interval(local_time(13, 0), new_data=False) == 60
+
+
+def test_backoff_doubles_up_to_max_interval(polling):
+    now = local_time(11, 0)
+    intervals = []
+    for _ in range(8):
+        intervals.append(polling.next_interval(now, new_data=False))
+        now += intervals[-1]
+
+    assert intervals == [120, 240, 480, 960, 1920, 3600, 3600, 3600]
+
+
+def test_interval_is_clamped_to_next_window_start(polling):
+    polling.interval = 3600
+    now = local_time(19, 50)
+
+    assert polling.seconds_until_active(now) == pytest.approx(40 * 60)
+    assert polling.next_interval(now, new_data=False) == pytest.approx(40 * 60)
+
+
+def test_new_measurement_resets_interval(polling):
+    polling.interval = 3600
+
+    assert polling.next_interval(local_time(13, 0), new_data=True) == 60
+
+
+def test_day_of_polling_keeps_latency_low_with_fewer_requests(polling):
+    """Replay a day: weigh-ins inside the learned windows are picked up within one minimal interval."""
+    day_start = TODAY.timestamp()
+    weigh_ins = [local_time(7, 4), local_time(21, 41)]
+    polls = []
+    now = day_start
+    while now < day_start + 24 * 60 * 60:
+        polls.append(now)
+        new_data = any(polls[-2] < time <= now for time in weigh_ins) if len(polls) > 1 else False
+        now += polling.next_interval(now, new_data)
+
+    latencies = [min(poll for poll in polls if poll >= time) - time for time in weigh_ins]
+    fixed_interval_polls = 24 * 60 * 60 // 60
+    assert max(latencies) <= 60
+    assert len(polls) < fixed_interval_polls / 3
@@ -0,0 +1,149 @@
+"""Tests for syncing paged measurement history into the history and the measurement store."""
+
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from custom_components.renpho.api_renpho import METRIC_TYPE_WEIGHT, RenphoWeight
+from custom_components.renpho.measurement_store import MeasurementStore
+
+USER_ID = "1"
+FIRST_TIME_STAMP = 1700000000
+PAGE_SIZE = 3
+
+
+def measurement(record_id: int) -> dict:
+    return {
+        "id": record_id, "b_user_id": int(USER_ID), "time_stamp": FIRST_TIME_STAMP + record_id * 86400,
+        "created_at": "2023-11-14", "created_stamp": FIRST_TIME_STAMP, "scale_type": 1, "scale_name": "Scale",
+        "mac": "00:00:00:00:00:00", "gender": 1, "height": 180, "height_unit": 1, "birthday": "1990-01-01",
+        "category_type": 0, "person_type": 0, "weight": 80.0 + record_id / 10, "weight_unit": 1, "bmi": 24.0,
+        "body_shape": 0, "internal_model": "0000", "method": 0, "sport_flag": 0, "local_created_at": "2023-11-14",
+        "accuracy_flag": 1, "time_zone": "+01:00",
+    }
+
+
+class PagedMeasurements:
+    """Serve records newest first, ``PAGE_SIZE`` per page, like the measurements endpoint."""
+
+    def __init__(self, count: int):
+        self.records = [measurement(record_id) for record_id in range(count)]
+        self.requests = 0
+
+    async def request(self, method, url, **kwargs):
+        self.requests += 1
+        query = parse_qs(urlsplit(url).query)
+        last_at = int(query["last_at"][0])
+        previous_at = int(query["previous_at"][0]) if "previous_at" in query else None
+        newest_first = sorted(
+            (record for record in self.records
+             if record["time_stamp"] > last_at and (previous_at is None or record["time_stamp"] < previous_at)),
+            key=lambda record: -record["time_stamp"],
+        )
+        page = newest_first[:PAGE_SIZE]
+        more = len(newest_first) > PAGE_SIZE
+        return {
+            "status_code": "20000", "status_message": "ok", "last_ary": page, "last_at": 0,
+            "previous_flag": int(more), "previous_at": page[-1]["time_stamp"] if more else 0,
+        }
+
+
+@pytest.fixture
+def api():
+    return RenphoWeight("user@example.com", "password", user_id=USER_ID)
+
+
+def test_full_sync_keeps_every_page(api, tmp_path):
+    server = PagedMeasurements(10)
+    api._request = server.request
+
+    async def sync():
+        api.measurement_store = MeasurementStore(str(tmp_path / "renpho.db"))
+        await api.measurement_store.async_open()
+        try:
+            await api.get_measurements()
+            assert len(api.weight_history) == 10
+
+            # Reconcile with a full sync; the older pages must survive it
+            api.full_sync_interval = 0
+            await api.get_measurements()
+            return await api.measurement_store.async_history(METRIC_TYPE_WEIGHT, USER_ID)
+        finally:
+            await api.measurement_store.async_close()
+
+    stored = asyncio.run(sync())
+
+    assert len(api.weight_history) == 10
+    assert len(stored) == 10
+    assert api.weight_info.id == 9
+    assert server.requests == 2 * 4
+
+
+def test_full_sync_removes_records_deleted_upstream(api):
+    server = PagedMeasurements(10)
+    api._request = server.request
+    asyncio.run(api.get_measurements())
+
+    server.records = [record for record in server.records if record["id"] != 2]
+    api.full_sync_interval = 0
+    asyncio.run(api.get_measurements())
+
+    assert len(api.weight_history) == 9
+    assert 2 not in {record.id for record in api.weight_history}
+
+
+def test_failed_page_does_not_replace_history(api):
+    server = PagedMeasurements(10)
+    api._request = server.request
+    asyncio.run(api.get_measurements())
+
+    async def failing_request(method, url, **kwargs):
+        if "previous_at" in url:
+            raise asyncio.TimeoutError()
+        return await server.request(method, url, **kwargs)
+
+    api._request = failing_request
+    api.full_sync_interval = 0
+
+    assert asyncio.run(api.get_measurements()) is None
+    assert len(api.weight_history) == 10
+
+
+def test_malformed_page_is_not_persisted(api, tmp_path):
+    server = PagedMeasurements(4)
+    api._request = server.request
+
+    async def sync():
+        api.measurement_store = MeasurementStore(str(tmp_path / "renpho.db"))
+        await api.measurement_store.async_open()
+        try:
+            await api.get_measurements()
+            # An edited record comes back without most of its fields
+            server.records[3] = {"id": 3, "b_user_id": int(USER_ID), "time_stamp": server.records[3]["time_stamp"]}
+            api.full_sync_interval = 0
+            assert await api.get_measurements() is None
+            return await api.measurement_store.async_history(METRIC_TYPE_WEIGHT, USER_ID)
+        finally:
+            await api.measurement_store.async_close()
+
+    stored = asyncio.run(sync())
+
+    assert sorted(record.id for record in stored) == [0, 1, 2, 3]
+    assert len(api.weight_history) == 4
+
+
+def test_account_without_measurements_is_not_a_failed_fetch(api):
+    server = PagedMeasurements(0)
+    api._request = server.request
+
+    assert asyncio.run(api.get_measurements()) == []
+    assert asyncio.run(api.refresh_data(["weight"])) == {"weight": []}
+
+
+def test_incremental_sync_without_new_records_returns_latest(api):
+    server = PagedMeasurements(4)
+    api._request = server.request
+    asyncio.run(api.get_measurements())
+
+    assert asyncio.run(api.get_measurements()).id == 3
@@ -0,0 +1,66 @@
+"""Tests for the per-endpoint refresh scheduler."""
+
+from custom_components.renpho.refresh_scheduler import RefreshScheduler
+
+
+def test_every_endpoint_is_due_on_first_refresh():
+    scheduler = RefreshScheduler({"weight": 60, "girth": 3600})
+
+    assert scheduler.due(1000.0) == ["weight", "girth"]
+
+
+def test_endpoint_waits_for_its_interval():
+    scheduler = RefreshScheduler({"weight": 60, "girth": 3600})
+    scheduler.record("weight", True, 1000.0)
+    scheduler.record("girth", True, 1000.0)
+
+    assert scheduler.due(1030.0) == []
+    assert scheduler.due(1060.0) == ["weight"]
+    assert scheduler.due(4600.0) == ["weight", "girth"]
+
+
+def test_refresh_arriving_slightly_early_is_due():
+    scheduler = RefreshScheduler({"weight": 60})
+    scheduler.record("weight", True, 1000.000050)
+
+    assert scheduler.due(1060.000030) == ["weight"]
+    assert scheduler.due(1059.5) == ["weight"]
+
+
+def test_failed_fetch_is_retried_and_becomes_stale():
+    scheduler = RefreshScheduler({"weight": 60})
+    scheduler.record("weight", True, 1000.0)
+    scheduler.record("weight", False, 1060.0)
+
+    assert scheduler.due(1061.0) == []
+    assert scheduler.due(1120.0) == ["weight"]
+    assert scheduler.stale(1181.0) == ["weight"]
+    assert scheduler.fetch_counts["weight"] == 2
+
+
+def test_failing_endpoint_backs_off_until_its_interval():
+    scheduler = RefreshScheduler({"weight": 60, "device_info": 86400})
+    now = 1000.0
+    retries = []
+    for _ in range(14):
+        if "device_info" in scheduler.due(now):
+            retries.append(now)
+            scheduler.record("device_info", False, now)
+        now += 60
+
+    # Retried after 1, 2, 4, ... refresh intervals instead of on every refresh
+    assert [int(later - earlier) for earlier, later in zip(retries, retries[1:])] == [60, 120, 240]
+    assert scheduler.retry_delay("device_info") == 480
+    assert scheduler.as_dict()["device_info"]["failures"] == 4
+
+
+def test_backoff_is_capped_and_cleared_by_a_success():
+    scheduler = RefreshScheduler({"weight": 60, "girth": 600})
+    for _ in range(6):
+        scheduler.record("girth", False, 1000.0)
+    assert scheduler.retry_delay("girth") == 600
+
+    scheduler.record("girth", True, 2000.0)
+    assert scheduler.retry_delay("girth") is None
+    assert scheduler.due(2060.0) == ["weight"]
+    assert scheduler.due(2600.0) == ["weight", "girth"]
@@ -0,0 +1,33 @@
+"""Tests for the sensor snapshot helpers."""
+
+import pytest
+
+from custom_components.renpho.history import MeasurementHistory
+from custom_components.renpho.snapshot import is_sparse
+
+
+@pytest.mark.parametrize("value", [None, "", 0, 0.0])
+def test_missing_sensor_values_are_sparse(value):
+    assert is_sparse(value)
+
+
+@pytest.mark.parametrize("value", [False, 1, 0.1, 72.5, "Scale"])
+def test_measured_values_are_not_sparse(value):
+    assert not is_sparse(value)
+
+
+def test_nullable_int_zero_from_history_is_sparse():
+    history = MeasurementHistory()
+    history.merge([{
+        "id": 1, "b_user_id": 1, "time_stamp": 1700000000, "created_at": "2023-11-14", "created_stamp": 1700000000,
+        "scale_type": 1, "scale_name": "Scale", "mac": "00:00:00:00:00:00", "gender": 1, "height": 180,
+        "height_unit": 1, "birthday": "1990-01-01", "category_type": 0, "person_type": 0, "weight": 80.0,
+        "weight_unit": 1, "bmi": 24.0, "body_shape": 0, "internal_model": "0000", "method": 0, "sport_flag": 0,
+        "local_created_at": "2023-11-14", "accuracy_flag": 1, "heart_rate": 0, "resistance20_trunk": 0, "bmr": 1650,
+    }])
+    row = history.row(0)
+
+    assert isinstance(row["heart_rate"], int)
+    assert is_sparse(row["heart_rate"])
+    assert is_sparse(row["resistance20_trunk"])
+    assert not is_sparse(row["bmr"])